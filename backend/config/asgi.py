@@ -1,12 +1,13 @@
 import os
-from channels.routing import ProtocolTypeRouter, URLRouter
 from django.core.asgi import get_asgi_application
-from hub.ws_auth import TokenAuthMiddleware
-from .routing import websocket_urlpatterns
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 django_asgi_app = get_asgi_application()
 
+from channels.routing import ProtocolTypeRouter, URLRouter  # noqa: E402
+from hub.ws_auth import TokenAuthMiddleware  # noqa: E402
+from .routing import websocket_urlpatterns  # noqa: E402
+
 application = ProtocolTypeRouter({
     'http': django_asgi_app,
     'websocket': TokenAuthMiddleware(URLRouter(websocket_urlpatterns)),
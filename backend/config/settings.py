@@ -1,5 +1,7 @@
 from pathlib import Path
 
+from corsheaders.defaults import default_headers
+
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 SECRET_KEY = 'dev-secret-key-change-me'
@@ -57,10 +59,41 @@ CHANNEL_LAYERS = {
     },
 }
 
+NOTIFICATION_FANOUT_BATCH_SIZE = 200
+NOTIFICATION_COALESCE_WINDOW_SECONDS = 300
+NOTIFICATION_RETENTION_DAYS = 90
+SIDE_EFFECT_QUEUE_SIZE = 10000
+SIDE_EFFECT_BATCH_SIZE = 500
+SIDE_EFFECT_SHUTDOWN_TIMEOUT = 2
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'OPTIONS': {'MAX_ENTRIES': 50000},
+    },
+    'reports': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / 'cache' / 'reports',
+        'OPTIONS': {'MAX_ENTRIES': 10000},
+    },
+}
+
+ISSUE_RENDER_CACHE_TIMEOUT = 60 * 60 * 24
+REPORT_CACHE_TIMEOUT = 60 * 60 * 24
+REPORT_CACHE_LOCK_TIMEOUT = 30
+REPORT_CACHE_LOCK_DIR = BASE_DIR / 'cache' / 'locks'
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'OPTIONS': {
+            'transaction_mode': 'IMMEDIATE',
+            'timeout': 20,
+        },
+        'TEST': {
+            'NAME': BASE_DIR / 'test_db.sqlite3',
+        },
     }
 }
 
@@ -83,6 +116,19 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'hub.renderers.FastJSONRenderer',
+        'hub.renderers.MessagePackRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'hub.renderers.FastJSONParser',
+        'hub.renderers.MessagePackParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
 }
 
 CORS_ALLOW_ALL_ORIGINS = True
+CORS_ALLOW_HEADERS = (*default_headers, 'if-none-match', 'prefer')
+CORS_EXPOSE_HEADERS = ['ETag', 'Preference-Applied']
@@ -0,0 +1,65 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from .models import Notification
+
+TARGET_KEYS = ('issueId', 'roomId', 'sprintId')
+MERGED_FIELDS = ['title', 'message', 'action_url', 'metadata', 'occurrences', 'created_at']
+
+
+def coalesce_key(notification: Notification) -> str:
+    metadata = notification.metadata or {}
+    target = next((metadata[key] for key in TARGET_KEYS if metadata.get(key)), None)
+    if not target:
+        return ''
+    event = metadata.get('event')
+    return f'{notification.notification_type}:{target}:{event}' if event else f'{notification.notification_type}:{target}'
+
+
+def _open_rows(notifications, since):
+    slots = {(n.user_id, n.coalesce_key) for n in notifications if n.coalesce_key}
+    if not slots:
+        return {}
+    rows = Notification.objects.filter(
+        user_id__in={user_id for user_id, _ in slots},
+        coalesce_key__in={key for _, key in slots},
+        is_read=False,
+        created_at__gte=since,
+    ).order_by('created_at')
+    return {(row.user_id, row.coalesce_key): row for row in rows if (row.user_id, row.coalesce_key) in slots}
+
+
+def _merge(row: Notification, latest: Notification, now):
+    row.title = latest.title
+    row.message = latest.message
+    row.action_url = latest.action_url
+    row.metadata = latest.metadata
+    row.occurrences += latest.occurrences
+    row.created_at = now
+
+
+def coalesce(notifications):
+    for notification in notifications:
+        notification.coalesce_key = coalesce_key(notification)
+    window = settings.NOTIFICATION_COALESCE_WINDOW_SECONDS
+    if window <= 0:
+        return list(notifications), []
+
+    now = timezone.now()
+    pending = _open_rows(notifications, now - timedelta(seconds=window))
+    fresh = []
+    merged = {}
+    for notification in notifications:
+        slot = (notification.user_id, notification.coalesce_key)
+        row = pending.get(slot) if notification.coalesce_key else None
+        if row is None:
+            fresh.append(notification)
+            if notification.coalesce_key:
+                pending[slot] = notification
+            continue
+        _merge(row, notification, now)
+        if row.pk:
+            merged[row.pk] = row
+    return fresh, list(merged.values())
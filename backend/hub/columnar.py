@@ -0,0 +1,22 @@
+def dictionary_encode(values):
+    codes = {}
+    encoded = [None if value is None else codes.setdefault(value, len(codes)) for value in values]
+    return {'dictionary': list(codes), 'codes': encoded}
+
+
+def _epoch_millis(values):
+    return [None if value is None else int(value.timestamp() * 1000) for value in values]
+
+
+def build_columns(rows, names, dictionary=(), timestamps=()):
+    values_by_name = dict(zip(names, map(list, zip(*rows)))) if rows else {name: [] for name in names}
+    columns = {}
+    for name in names:
+        values = values_by_name[name]
+        if name in dictionary:
+            columns[name] = dictionary_encode(values)
+        elif name in timestamps:
+            columns[name] = _epoch_millis(values)
+        else:
+            columns[name] = values
+    return columns
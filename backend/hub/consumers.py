@@ -1,5 +1,8 @@
+import asyncio
+
 from channels.generic.websocket import AsyncJsonWebsocketConsumer
 from channels.db import database_sync_to_async
+from . import fanout
 from .models import ChatMessage, ChatParticipant, ChatRoom
 
 
@@ -11,6 +14,7 @@ class NotificationConsumer(AsyncJsonWebsocketConsumer):
             return
 
         self.group_name = f'user_notifications_{user.id}'
+        fanout.bind_loop(asyncio.get_running_loop())
         await self.channel_layer.group_add(self.group_name, self.channel_name)
         await self.accept()
         await self.send_json({'type': 'connected'})
@@ -24,7 +28,11 @@ class NotificationConsumer(AsyncJsonWebsocketConsumer):
             await self.send_json({'type': 'pong'})
 
     async def notification_event(self, event):
-        await self.send_json({'type': 'notification_event', 'event': event.get('event', 'updated')})
+        payload = {'type': 'notification_event', 'event': event.get('event', 'updated')}
+        for key in ('notifications', 'notificationIds', 'unreadCount'):
+            if key in event:
+                payload[key] = event[key]
+        await self.send_json(payload)
 
 
 class ChatConsumer(AsyncJsonWebsocketConsumer):
@@ -46,6 +54,7 @@ class ChatConsumer(AsyncJsonWebsocketConsumer):
 
         self.room_uid = room_uid
         self.group_name = f'chat_room_{room_uid}'
+        fanout.bind_loop(asyncio.get_running_loop())
         await self.channel_layer.group_add(self.group_name, self.channel_name)
         await self.accept()
         await self.send_json({'type': 'connected', 'roomId': room_uid})
@@ -0,0 +1,107 @@
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import Count, F, Sum
+
+from .models import Issue, Sprint, SprintIssueCounter
+
+COUNTED_FIELDS = ('sprint_id', 'status', 'assignee_id')
+
+
+def state(issue: Issue):
+    if any(field in issue.get_deferred_fields() for field in COUNTED_FIELDS):
+        return None
+    return tuple(getattr(issue, field) for field in COUNTED_FIELDS)
+
+
+def stored_state(issue_id):
+    return Issue.objects.filter(pk=issue_id).values_list(*COUNTED_FIELDS).first()
+
+
+def _bump(key, delta):
+    sprint_id, status, assignee_id = key
+    counters = SprintIssueCounter.objects.filter(sprint_id=sprint_id, status=status, assignee_id=assignee_id)
+    if counters.update(count=F('count') + delta) or delta < 0:
+        return
+    _, created = SprintIssueCounter.objects.get_or_create(
+        sprint_id=sprint_id, status=status, assignee_id=assignee_id, defaults={'count': delta}
+    )
+    if not created:
+        counters.update(count=F('count') + delta)
+
+
+def apply(deltas: Counter):
+    changes = {key: delta for key, delta in deltas.items() if delta and key and key[0]}
+    if not changes:
+        return
+    with transaction.atomic(savepoint=False):
+        for key, delta in changes.items():
+            _bump(key, delta)
+
+
+def move(pairs):
+    deltas = Counter()
+    for before, after in pairs:
+        if before != after:
+            deltas[before] -= 1
+            deltas[after] += 1
+    apply(deltas)
+
+
+def unassign_user(user_id):
+    with transaction.atomic():
+        deltas = Counter()
+        for sprint_id, status, count in SprintIssueCounter.objects.filter(assignee_id=user_id).values_list('sprint_id', 'status', 'count'):
+            deltas[(sprint_id, status, None)] += count
+        SprintIssueCounter.objects.filter(assignee_id=user_id).delete()
+        apply(deltas)
+
+
+def rebuild(sprint_ids=None):
+    issues = Issue.objects.filter(sprint__isnull=False)
+    counters = SprintIssueCounter.objects.all()
+    if sprint_ids is not None:
+        issues = issues.filter(sprint_id__in=sprint_ids)
+        counters = counters.filter(sprint_id__in=sprint_ids)
+    rows = list(issues.order_by().values_list('sprint_id', 'status', 'assignee_id').annotate(total=Count('id')))
+    with transaction.atomic():
+        counters.delete()
+        SprintIssueCounter.objects.bulk_create(
+            [
+                SprintIssueCounter(sprint_id=sprint_id, status=status, assignee_id=assignee_id, count=total)
+                for sprint_id, status, assignee_id, total in rows
+            ],
+            batch_size=1000,
+        )
+        return len(rows)
+
+
+def sprint_breakdown(sprint):
+    by_status = {value: 0 for value, _ in Issue.STATUS_CHOICES}
+    by_assignee = {}
+    rows = (
+        SprintIssueCounter.objects.filter(sprint=sprint, count__gt=0)
+        .values_list('status', 'assignee__profile__uid')
+        .annotate(total=Sum('count'))
+        .order_by()
+    )
+    for status, assignee_uid, total in rows:
+        by_status[status] = by_status.get(status, 0) + total
+        if assignee_uid:
+            by_assignee[assignee_uid] = by_assignee.get(assignee_uid, 0) + total
+    return by_status, by_assignee
+
+
+def dashboard_stats(project):
+    active_sprint = Sprint.objects.filter(project=project, status='active').first()
+    by_status, by_assignee = sprint_breakdown(active_sprint)
+    total = sum(by_status.values())
+    return {
+        'activeSprintId': active_sprint.uid if active_sprint else None,
+        'stats': {
+            'byStatus': by_status,
+            'total': total,
+            'donePercent': round((by_status['done'] / total) * 100) if total else 0,
+            'byAssignee': by_assignee,
+        },
+    }
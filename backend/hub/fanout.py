@@ -0,0 +1,78 @@
+import asyncio
+import logging
+import time
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+SEND_TIMEOUT = 30
+_consumer_loop = None
+
+
+def user_group(user_id) -> str:
+    return f'user_notifications_{user_id}'
+
+
+def chat_group(room_uid: str) -> str:
+    return f'chat_room_{room_uid}'
+
+
+async def _send_group(channel_layer, group, messages):
+    for message in messages:
+        await channel_layer.group_send(group, message)
+
+
+async def _send_batch(channel_layer, batch):
+    results = await asyncio.gather(
+        *(_send_group(channel_layer, group, messages) for group, messages in batch),
+        return_exceptions=True,
+    )
+    return [(group, result) for (group, _), result in zip(batch, results) if isinstance(result, Exception)]
+
+
+async def _send_all(channel_layer, messages, batch_size):
+    by_group = {}
+    for group, message in messages:
+        by_group.setdefault(group, []).append(message)
+    groups = list(by_group.items())
+    latencies = []
+    for start in range(0, len(groups), batch_size):
+        batch = groups[start:start + batch_size]
+        started = time.perf_counter()
+        failures = await _send_batch(channel_layer, batch)
+        elapsed = (time.perf_counter() - started) * 1000
+        latencies.append(elapsed)
+        logger.info('fan-out batch: %d groups in %.2f ms, %d failed', len(batch), elapsed, len(failures))
+        for group, error in failures:
+            logger.warning('fan-out to %s failed: %r', group, error)
+    return latencies
+
+
+def bind_loop(loop):
+    global _consumer_loop
+    _consumer_loop = loop
+
+
+def send(messages, batch_size: int | None = None):
+    messages = list(messages)
+    channel_layer = get_channel_layer()
+    if not messages or not channel_layer:
+        return []
+    batch_size = batch_size or settings.NOTIFICATION_FANOUT_BATCH_SIZE
+    loop = _consumer_loop
+    if loop is not None and loop.is_running():
+        sending = asyncio.run_coroutine_threadsafe(_send_all(channel_layer, messages, batch_size), loop)
+        return sending.result(timeout=SEND_TIMEOUT)
+    return async_to_sync(_send_all)(channel_layer, messages, batch_size)
+
+
+def notification_event(user_id, event: str, unread_count: int, **payload):
+    return user_group(user_id), {
+        'type': 'notification_event',
+        'event': event,
+        'unreadCount': unread_count,
+        **payload,
+    }
@@ -0,0 +1,196 @@
+from datetime import date, datetime
+
+import numpy as np
+from django.utils import timezone
+
+from .models import Issue, IssueTransition
+
+STATUSES = tuple(value for value, _ in Issue.STATUS_CHOICES)
+STATUS_CODES = {status: code for code, status in enumerate(STATUSES)}
+TODO = STATUS_CODES['todo']
+DONE = STATUS_CODES['done']
+STARTED = (STATUS_CODES['in_progress'], STATUS_CODES['in_review'])
+DAY_SECONDS = 86400
+PERCENTILES = (50, 75, 85, 95)
+MAX_WINDOW_DAYS = 730
+CYCLE_TIME_DAYS = 90
+LEAD_TIME_DAYS = 90
+THROUGHPUT_WEEKS = 12
+MAX_THROUGHPUT_WEEKS = 104
+CUMULATIVE_FLOW_DAYS = 30
+_EPOCH = date(1970, 1, 1).toordinal()
+
+
+def parse_window(value, default: int, maximum: int = MAX_WINDOW_DAYS) -> int:
+    try:
+        size = int(value)
+    except (TypeError, ValueError):
+        return default
+    return min(max(size, 1), maximum)
+
+
+def _epoch(values):
+    return np.fromiter(map(datetime.timestamp, values), dtype=np.float64, count=len(values))
+
+
+def _codes(values):
+    return np.fromiter(map(STATUS_CODES.__getitem__, values), dtype=np.int8, count=len(values))
+
+
+def build_history(issue_rows, transition_rows):
+    if not issue_rows:
+        empty = np.empty(0)
+        return empty, empty.astype(np.int8), empty.astype(np.int64), empty, empty.astype(np.int8)
+    ids, created, updated, current = zip(*issue_rows)
+    ids = np.array(ids, dtype=np.int64)
+    order = np.argsort(ids, kind='stable')
+    ids = ids[order]
+    created = _epoch(created)[order]
+    updated = _epoch(updated)[order]
+    current = _codes(current)[order]
+
+    if transition_rows:
+        event_ids, event_at, event_status = zip(*transition_rows)
+        issue = np.searchsorted(ids, np.array(event_ids, dtype=np.int64))
+        at = _epoch(event_at)
+        status = _codes(event_status)
+    else:
+        issue = np.empty(0, dtype=np.int64)
+        at = np.empty(0)
+        status = np.empty(0, dtype=np.int8)
+
+    legacy = np.ones(len(ids), dtype=bool)
+    legacy[issue] = False
+    legacy = np.flatnonzero(legacy)
+    legacy_done = legacy[current[legacy] == DONE]
+    issue = np.concatenate([issue, legacy, legacy_done])
+    at = np.concatenate([at, created[legacy], updated[legacy_done]])
+    status = np.concatenate([status, np.where(current[legacy] == DONE, TODO, current[legacy]).astype(np.int8), current[legacy_done]])
+
+    order = np.lexsort((at, issue))
+    return created, current, issue[order], at[order], status[order]
+
+
+def load_history(project_id):
+    issue_rows = list(
+        Issue.objects.filter(project_id=project_id).order_by().values_list('id', 'created_at', 'updated_at', 'status')
+    )
+    transition_rows = list(
+        IssueTransition.objects.filter(project_id=project_id)
+        .order_by('issue_id', 'created_at', 'id')
+        .values_list('issue_id', 'created_at', 'status')
+    )
+    return build_history(issue_rows, transition_rows)
+
+
+def _boundaries(issue, status):
+    first = np.ones(len(issue), dtype=bool)
+    first[1:] = issue[1:] != issue[:-1]
+    changed = first.copy()
+    changed[1:] |= status[1:] != status[:-1]
+    return first, changed
+
+
+def _per_issue(size, issue, at, mask, last):
+    values = np.full(size, np.nan)
+    issue, at = issue[mask], at[mask]
+    pick = np.ones(len(issue), dtype=bool)
+    if last:
+        pick[:-1] = issue[1:] != issue[:-1]
+    else:
+        pick[1:] = issue[1:] != issue[:-1]
+    values[issue[pick]] = at[pick]
+    return values
+
+
+def milestones(history):
+    created, current, issue, at, status = history
+    _, changed = _boundaries(issue, status)
+    done_at = _per_issue(len(created), issue, at, changed & (status == DONE), last=True)
+    done_at[current != DONE] = np.nan
+    started_at = _per_issue(len(created), issue, at, changed & np.isin(status, STARTED), last=False)
+    return done_at, started_at
+
+
+def _offset(now):
+    return timezone.localtime(now).utcoffset().total_seconds()
+
+
+def _days(seconds, offset):
+    return np.floor((seconds + offset) / DAY_SECONDS).astype(np.int64)
+
+
+def _iso_day(day) -> str:
+    return date.fromordinal(_EPOCH + int(day)).isoformat()
+
+
+def _distribution(durations):
+    if not durations.size:
+        return {
+            'count': 0,
+            'meanDays': None,
+            'percentiles': {str(p): None for p in PERCENTILES},
+            'histogram': [],
+        }
+    histogram = np.bincount(np.floor(durations).astype(np.int64))
+    return {
+        'count': int(durations.size),
+        'meanDays': round(float(durations.mean()), 2),
+        'percentiles': {str(p): round(float(v), 2) for p, v in zip(PERCENTILES, np.percentile(durations, PERCENTILES))},
+        'histogram': [{'days': int(day), 'count': int(histogram[day])} for day in np.flatnonzero(histogram)],
+    }
+
+
+def _completed_since(done_at, days, now):
+    since = now.timestamp() - days * DAY_SECONDS
+    return ~np.isnan(done_at) & (done_at >= since)
+
+
+def cycle_time(history, days: int, now=None):
+    now = now or timezone.now()
+    done_at, started_at = milestones(history)
+    mask = _completed_since(done_at, days, now) & ~np.isnan(started_at) & (started_at <= done_at)
+    return {'days': days, **_distribution((done_at[mask] - started_at[mask]) / DAY_SECONDS)}
+
+
+def lead_time(history, days: int, now=None):
+    now = now or timezone.now()
+    created = history[0]
+    done_at, _ = milestones(history)
+    mask = _completed_since(done_at, days, now)
+    return {'days': days, **_distribution(np.maximum(done_at[mask] - created[mask], 0) / DAY_SECONDS)}
+
+
+def throughput(history, weeks: int, now=None):
+    now = now or timezone.now()
+    offset = _offset(now)
+    done_at, _ = milestones(history)
+    today = int(_days(np.array([now.timestamp()]), offset)[0])
+    first = today - (today + 3) % 7 - 7 * (weeks - 1)
+    completed = _days(done_at[~np.isnan(done_at)], offset) - first
+    completed = completed[(completed >= 0) & (completed <= today - first)]
+    counts = np.bincount(completed // 7, minlength=weeks)
+    return [{'weekStart': _iso_day(first + 7 * week), 'completed': int(counts[week])} for week in range(weeks)]
+
+
+def cumulative_flow(history, days: int, now=None):
+    now = now or timezone.now()
+    offset = _offset(now)
+    _, _, issue, at, status = history
+    first, changed = _boundaries(issue, status)
+    status = status.astype(np.int64)
+    today = int(_days(np.array([now.timestamp()]), offset)[0])
+    start = today - days + 1
+
+    day = np.maximum(_days(at, offset), start) - start
+    entered = changed & (day < days)
+    left = entered & ~first
+    previous = np.roll(status, 1)
+    cells = np.concatenate([status[entered] * days + day[entered], previous[left] * days + day[left]])
+    weights = np.concatenate([np.ones(entered.sum()), -np.ones(left.sum())])
+    counts = np.bincount(cells.astype(np.int64), weights=weights, minlength=len(STATUSES) * days)
+    counts = np.cumsum(counts.reshape(len(STATUSES), days), axis=1).astype(np.int64)
+    return [
+        {'date': _iso_day(start + index), **{name: int(counts[code, index]) for code, name in enumerate(STATUSES)}}
+        for index in range(days)
+    ]
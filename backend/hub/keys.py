@@ -0,0 +1,40 @@
+import re
+
+from django.db import transaction
+from django.db.models import F
+
+from .models import Epic, Issue, ProjectKeySequence
+
+ISSUE_NUMBER_START = 101
+EPIC_NUMBER_START = 1
+KEY_NUMBER_PATTERN = re.compile(r'(\d+)$')
+
+
+def _next_number(keys, start: int) -> int:
+    numbers = [int(match.group(1)) for match in map(KEY_NUMBER_PATTERN.search, keys) if match]
+    return max([start, *(number + 1 for number in numbers)])
+
+
+def _sequence_defaults(project):
+    return {
+        'next_issue_number': _next_number(Issue.objects.filter(project=project).values_list('key', flat=True), ISSUE_NUMBER_START),
+        'next_epic_number': _next_number(Epic.objects.filter(project=project).values_list('key', flat=True), EPIC_NUMBER_START),
+    }
+
+
+def _allocate(project, field: str, count: int) -> range:
+    sequences = ProjectKeySequence.objects.filter(project=project)
+    with transaction.atomic():
+        if not sequences.update(**{field: F(field) + count}):
+            ProjectKeySequence.objects.get_or_create(project=project, defaults=_sequence_defaults(project))
+            sequences.update(**{field: F(field) + count})
+        end = sequences.values_list(field, flat=True).get()
+    return range(end - count, end)
+
+
+def allocate_issue_keys(project, count: int = 1) -> list[str]:
+    return [f'{project.key}-{number}' for number in _allocate(project, 'next_issue_number', count)]
+
+
+def allocate_epic_keys(project, count: int = 1) -> list[str]:
+    return [f'{project.key}-E{number}' for number in _allocate(project, 'next_epic_number', count)]
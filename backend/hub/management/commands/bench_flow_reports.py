@@ -0,0 +1,119 @@
+import random
+import statistics
+import time
+import uuid
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from hub import flow
+from hub.models import Issue, IssueTransition, Project
+
+NEXT_STATUSES = {
+    'todo': ('in_progress',),
+    'in_progress': ('in_review', 'todo'),
+    'in_review': ('done', 'in_progress'),
+    'done': ('in_progress',),
+}
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the cycle-time, lead-time, throughput and cumulative flow reports on synthetic status history'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--transitions', type=int, default=500000)
+        parser.add_argument('--issues', type=int, default=50000)
+        parser.add_argument('--days', type=int, default=365, help='Span of the synthetic history in days')
+        parser.add_argument('--repeat', type=int, default=5)
+        parser.add_argument('--seed', type=int, default=7)
+        parser.add_argument('--database', action='store_true', help='Also write the history (rolled back) and time loading it')
+
+    def handle(self, *args, **options):
+        issue_rows, transition_rows = self._synthesize(options)
+        self.stdout.write(f'{len(issue_rows)} issues, {len(transition_rows)} transitions over {options["days"]} days')
+
+        build = self._time(lambda: flow.build_history(issue_rows, transition_rows), options['repeat'])
+        history = flow.build_history(issue_rows, transition_rows)
+        reports = [
+            ('build arrays', build),
+            ('cycle time', self._time(lambda: flow.cycle_time(history, 90), options['repeat'])),
+            ('lead time', self._time(lambda: flow.lead_time(history, 90), options['repeat'])),
+            ('throughput', self._time(lambda: flow.throughput(history, 52), options['repeat'])),
+            ('cumulative flow', self._time(lambda: flow.cumulative_flow(history, options['days']), options['repeat'])),
+        ]
+        if options['database']:
+            with transaction.atomic():
+                project_id = self._write(issue_rows, transition_rows)
+                reports.insert(0, ('load from db', self._time(lambda: flow.load_history(project_id), 1)))
+                transaction.set_rollback(True)
+
+        self.stdout.write(f"{'step':<16} {'ms':>10}")
+        for name, elapsed in reports:
+            self.stdout.write(f'{name:<16} {elapsed:>10.2f}')
+
+    def _synthesize(self, options):
+        rng = random.Random(options['seed'])
+        now = timezone.now()
+        span = options['days'] * 86400
+        issues = max(options['issues'], 1)
+        steps = [options['transitions'] // issues + (1 if n < options['transitions'] % issues else 0) for n in range(issues)]
+        issue_rows = []
+        transition_rows = []
+        for pk, count in enumerate(steps, start=1):
+            at = now - timedelta(seconds=rng.uniform(0, span))
+            created_at = at
+            status = 'todo'
+            for step in range(count):
+                if step:
+                    at = min(at + timedelta(seconds=rng.expovariate(1 / 86400)), now)
+                    status = rng.choice(NEXT_STATUSES[status])
+                transition_rows.append((pk, at, status))
+            issue_rows.append((pk, created_at, at, status))
+        return issue_rows, transition_rows
+
+    def _write(self, issue_rows, transition_rows):
+        User = get_user_model()
+        user = User.objects.filter(is_superuser=True).first() or User.objects.first()
+        if not user:
+            user = User.objects.create_user(username='bench@example.com', email='bench@example.com', password='bench')
+        project = Project.objects.create(name='Benchmark', key=f'B{uuid.uuid4().hex[:8].upper()}', lead=user)
+        issues = Issue.objects.bulk_create(
+            [
+                Issue(
+                    project=project,
+                    key=f'{project.key}-{pk}',
+                    title=f'Benchmark issue {pk}',
+                    issue_type='task',
+                    status=status,
+                    reporter=user,
+                )
+                for pk, _, _, status in issue_rows
+            ],
+            batch_size=1000,
+        )
+        ids = {pk: issue.pk for (pk, *_), issue in zip(issue_rows, issues)}
+        IssueTransition.objects.bulk_create(
+            [
+                IssueTransition(
+                    issue_id=ids[pk],
+                    project=project,
+                    changes=IssueTransition.CHANGE_STATUS,
+                    status=status,
+                    created_at=at,
+                )
+                for pk, at, status in transition_rows
+            ],
+            batch_size=2000,
+        )
+        return project.id
+
+    def _time(self, func, repeat):
+        samples = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func()
+            samples.append((time.perf_counter() - started) * 1000)
+        return statistics.median(samples)
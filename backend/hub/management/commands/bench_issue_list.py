@@ -0,0 +1,83 @@
+import statistics
+import time
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from hub.models import Issue, Project
+from hub.views import IssuesView
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the paginated issue list as the issue table grows (all rows are rolled back)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', default='1000,10000,40000', help='Comma separated table sizes to measure')
+        parser.add_argument('--limit', type=int, default=50)
+        parser.add_argument('--repeat', type=int, default=5)
+        parser.add_argument('--full', action='store_true', help='Also time the unpaginated list (slow on large sizes)')
+
+    def handle(self, *args, **options):
+        sizes = sorted(int(size) for size in options['sizes'].split(',') if size.strip())
+        with transaction.atomic():
+            self._run(sizes, options)
+            transaction.set_rollback(True)
+
+    def _run(self, sizes, options):
+        User = get_user_model()
+        user = User.objects.filter(is_superuser=True).first() or User.objects.first()
+        if not user:
+            user = User.objects.create_user(username='bench@example.com', email='bench@example.com', password='bench')
+        project = Project.objects.create(name='Benchmark', key=f'B{uuid.uuid4().hex[:8].upper()}', lead=user)
+        factory = APIRequestFactory()
+        view = IssuesView.as_view()
+        created = 0
+
+        self.stdout.write(f"{'rows':>8} {'first page ms':>14} {'deep page ms':>13} {'full list ms':>13}")
+        for size in sizes:
+            Issue.objects.bulk_create(
+                [
+                    Issue(
+                        project=project,
+                        key=f'{project.key}-{n}',
+                        title=f'Benchmark issue {n}',
+                        description='Synthetic issue created by bench_issue_list',
+                        issue_type='task',
+                        reporter=user,
+                        assignee=user,
+                    )
+                    for n in range(created, size)
+                ],
+                batch_size=1000,
+            )
+            created = max(created, size)
+
+            params = {'project_id': project.uid, 'limit': options['limit']}
+            first = self._time(view, factory, user, params, options['repeat'])
+            response = self._call(view, factory, user, params)
+            for _ in range(5):
+                if not response.data['next']:
+                    break
+                response = self._call(view, factory, user, {**params, 'cursor': response.data['next']})
+            deep_params = {**params, 'cursor': response.data['next']} if response.data['next'] else params
+            deep = self._time(view, factory, user, deep_params, options['repeat'])
+            full = f"{self._time(view, factory, user, {'project_id': project.uid}, 1):.2f}" if options['full'] else '-'
+            self.stdout.write(f'{size:>8} {first:>14.2f} {deep:>13.2f} {full:>13}')
+
+    def _call(self, view, factory, user, params):
+        request = factory.get('/api/issues/', params)
+        force_authenticate(request, user=user)
+        response = view(request)
+        response.render()
+        return response
+
+    def _time(self, view, factory, user, params, repeat):
+        samples = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            self._call(view, factory, user, params)
+            samples.append((time.perf_counter() - started) * 1000)
+        return statistics.median(samples)
@@ -0,0 +1,40 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from rest_framework.renderers import JSONRenderer
+
+from hub.models import ChatMessage, Issue
+from hub.renderers import FastJSONRenderer, MessagePackRenderer
+from hub.serializers import ChatMessageSerializer, IssueSerializer
+
+
+class Command(BaseCommand):
+    help = 'Compare render time and payload size of the JSON, fast JSON and MessagePack renderers on the current data'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--copies', type=int, default=50, help='Repeat each payload this many times to get measurable sizes')
+        parser.add_argument('--repeat', type=int, default=10)
+
+    def handle(self, *args, **options):
+        issues = Issue.objects.select_related(
+            'assignee__profile', 'reporter__profile', 'sprint', 'epic', 'parent'
+        ).prefetch_related(
+            'labels', 'comments__author__profile', 'links__target_issue', 'watchers__profile', 'attachments__uploaded_by__profile'
+        )
+        messages = ChatMessage.objects.select_related('sender__profile', 'room')
+        payloads = {
+            'issues': list(IssueSerializer(issues, many=True).data) * options['copies'],
+            'chat': list(ChatMessageSerializer(messages, many=True).data) * options['copies'],
+        }
+        renderers = [('drf-json', JSONRenderer()), ('fast-json', FastJSONRenderer()), ('msgpack', MessagePackRenderer())]
+
+        self.stdout.write(f"{'payload':<8} {'items':>7} {'renderer':<10} {'median ms':>10} {'bytes':>10}")
+        for name, data in payloads.items():
+            for label, renderer in renderers:
+                samples = []
+                for _ in range(options['repeat']):
+                    started = time.perf_counter()
+                    body = renderer.render(data, renderer.media_type, {})
+                    samples.append((time.perf_counter() - started) * 1000)
+                self.stdout.write(f'{name:<8} {len(data):>7} {label:<10} {statistics.median(samples):>10.2f} {len(body):>10}')
@@ -0,0 +1,72 @@
+import os
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from hub.models import Notification
+from hub.renderers import dumps
+from hub.serializers import NotificationSerializer
+
+
+class Command(BaseCommand):
+    help = 'Delete (optionally archiving first) read notifications older than the retention window, one keyset batch at a time'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=settings.NOTIFICATION_RETENTION_DAYS)
+        parser.add_argument('--batch-size', type=int, default=1000, help='Rows archived and deleted per transaction')
+        parser.add_argument('--sleep', type=float, default=0.05, help='Seconds to pause between batches so writers can get the lock')
+        parser.add_argument('--archive', help='Append archived rows to this NDJSON file in the same batch that deletes them')
+        parser.add_argument('--dry-run', action='store_true')
+
+    def handle(self, *args, **options):
+        if options['days'] < 1 or options['batch_size'] < 1:
+            raise CommandError('--days and --batch-size must be positive')
+        cutoff = timezone.now() - timedelta(days=options['days'])
+        expired = Notification.objects.filter(is_read=True, created_at__lt=cutoff).order_by('id')
+        archive = open(options['archive'], 'ab') if options['archive'] else None
+        removed = 0
+        last_id = 0
+        started = time.perf_counter()
+        try:
+            while True:
+                if options['dry_run']:
+                    ids = list(expired.filter(id__gt=last_id).values_list('id', flat=True)[:options['batch_size']])
+                    if not ids:
+                        break
+                    last_id = ids[-1]
+                    removed += len(ids)
+                    continue
+                position = archive.tell() if archive else None
+                try:
+                    with transaction.atomic():
+                        rows = list(expired.filter(id__gt=last_id)[:options['batch_size']])
+                        if not rows:
+                            break
+                        last_id = rows[-1].id
+                        deleted, _ = Notification.objects.filter(id__in=[row.id for row in rows]).delete()
+                        if archive:
+                            archive.write(b''.join(
+                                dumps({**NotificationSerializer(row).data, 'userId': row.user_id}) + b'\n' for row in rows
+                            ))
+                            archive.flush()
+                            os.fsync(archive.fileno())
+                except BaseException:
+                    if archive:
+                        archive.truncate(position)
+                    raise
+                removed += deleted
+                if options['sleep']:
+                    time.sleep(options['sleep'])
+        finally:
+            if archive:
+                archive.close()
+
+        verb = 'Would delete' if options['dry_run'] else 'Deleted'
+        elapsed = (time.perf_counter() - started) * 1000
+        self.stdout.write(self.style.SUCCESS(
+            f'{verb} {removed} read notifications older than {options["days"]} days in {elapsed:.2f} ms.'
+        ))
@@ -0,0 +1,52 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from hub import report_cache
+from hub.models import Project
+
+
+def _setup_worker():
+    django.setup()
+
+
+def _precompute(project_id):
+    started = time.perf_counter()
+    project = Project.objects.get(pk=project_id)
+    count = report_cache.precompute(project)
+    connections.close_all()
+    return project.key, count, (time.perf_counter() - started) * 1000
+
+
+class Command(BaseCommand):
+    help = 'Fill the shared report cache for every project (or the given ones) using a pool of worker processes'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--project', action='append', default=[], help='Project key to precompute (repeatable, default all)')
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+
+    def handle(self, *args, **options):
+        projects = Project.objects.order_by('key')
+        if options['project']:
+            projects = projects.filter(key__in=options['project'])
+            missing = sorted(set(options['project']) - set(projects.values_list('key', flat=True)))
+            if missing:
+                raise CommandError(f"Unknown project: {', '.join(missing)}")
+        project_ids = list(projects.values_list('id', flat=True))
+        if not project_ids:
+            return
+
+        started = time.perf_counter()
+        total = 0
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=max(1, min(options['workers'], len(project_ids))), initializer=_setup_worker) as pool:
+            for future in as_completed([pool.submit(_precompute, pk) for pk in project_ids]):
+                key, count, elapsed = future.result()
+                total += count
+                self.stdout.write(f'{key:<12} {count:>4} reports {elapsed:>10.2f} ms')
+        elapsed = (time.perf_counter() - started) * 1000
+        self.stdout.write(self.style.SUCCESS(f'Precomputed {total} reports for {len(project_ids)} projects in {elapsed:.2f} ms.'))
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from hub import counters
+from hub.models import Sprint
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the per-sprint status and assignee counters read by the dashboard'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sprint', action='append', default=[], help='Sprint uid to rebuild (repeatable, default all)')
+
+    @transaction.atomic
+    def handle(self, *args, **options):
+        sprint_ids = None
+        if options['sprint']:
+            found = dict(Sprint.objects.filter(uid__in=options['sprint']).values_list('uid', 'id'))
+            missing = sorted(set(options['sprint']) - set(found))
+            if missing:
+                raise CommandError(f"Unknown sprint: {', '.join(missing)}")
+            sprint_ids = list(found.values())
+        count = counters.rebuild(sprint_ids)
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {count} counter rows.'))
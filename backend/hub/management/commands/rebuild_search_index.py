@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from hub import search
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the full-text search index over issues, comments and epics'
+
+    @transaction.atomic
+    def handle(self, *args, **options):
+        if not search.is_available():
+            raise CommandError('Full-text search requires the SQLite database backend')
+        count = search.rebuild()
+        self.stdout.write(self.style.SUCCESS(f'Indexed {count} documents.'))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from hub import unread
+
+
+class Command(BaseCommand):
+    help = 'Recompute per-user unread notification counters and fix any that drifted'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        checked, fixed = unread.reconcile(options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Checked {checked} counters, fixed {fixed}.'))
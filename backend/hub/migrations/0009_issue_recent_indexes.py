@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:52
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hub', '0008_alter_notification_notification_type'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(fields=['-updated_at', '-id'], name='hub_issue_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(fields=['project', '-updated_at', '-id'], name='hub_issue_project_recent_idx'),
+        ),
+    ]
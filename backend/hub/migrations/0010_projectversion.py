@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:54
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def create_project_versions(apps, schema_editor):
+    Project = apps.get_model('hub', 'Project')
+    ProjectVersion = apps.get_model('hub', 'ProjectVersion')
+    ProjectVersion.objects.bulk_create([ProjectVersion(project_id=pk) for pk in Project.objects.values_list('pk', flat=True)])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hub', '0009_issue_recent_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectVersion',
+            fields=[
+                ('project', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='change_version', serialize=False, to='hub.project')),
+                ('version', models.BigIntegerField(default=1)),
+            ],
+        ),
+        migrations.RunPython(create_project_versions, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,41 @@
+from django.db import migrations
+
+
+def create_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    schema_editor.execute(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS hub_search_index USING fts5("
+        "key, title, body, kind UNINDEXED, issue_id UNINDEXED, project_id UNINDEXED, "
+        "tokenize = 'unicode61 remove_diacritics 2')"
+    )
+    schema_editor.execute(
+        "INSERT INTO hub_search_index (rowid, key, title, body, kind, issue_id, project_id) "
+        "SELECT id * 4, key, title, description, 'issue', id, project_id FROM hub_issue"
+    )
+    schema_editor.execute(
+        "INSERT INTO hub_search_index (rowid, key, title, body, kind, issue_id, project_id) "
+        "SELECT c.id * 4 + 1, '', '', c.content, 'comment', c.issue_id, i.project_id "
+        "FROM hub_issuecomment c INNER JOIN hub_issue i ON i.id = c.issue_id"
+    )
+    schema_editor.execute(
+        "INSERT INTO hub_search_index (rowid, key, title, body, kind, issue_id, project_id) "
+        "SELECT id * 4 + 2, key, name, summary, 'epic', NULL, project_id FROM hub_epic"
+    )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    schema_editor.execute('DROP TABLE IF EXISTS hub_search_index')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hub', '0010_projectversion'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:57
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hub', '0011_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectChange',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.BigIntegerField()),
+                ('entity', models.CharField(choices=[('issue', 'Issue'), ('comment', 'Comment'), ('sprint', 'Sprint'), ('epic', 'Epic'), ('label', 'Label')], max_length=16)),
+                ('uid', models.CharField(max_length=32)),
+                ('deleted', models.BooleanField(default=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='changes', to='hub.project')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['project', 'version'], name='hub_change_project_version_idx')],
+            },
+        ),
+    ]
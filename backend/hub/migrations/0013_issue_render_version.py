@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hub', '0012_projectchange'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='issue',
+            name='render_version',
+            field=models.PositiveIntegerField(default=1),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:03
+
+import re
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+KEY_NUMBER_PATTERN = re.compile(r'(\d+)$')
+
+
+def _next_number(keys, start):
+    numbers = [int(match.group(1)) for match in map(KEY_NUMBER_PATTERN.search, keys) if match]
+    return max([start, *(number + 1 for number in numbers)])
+
+
+def create_key_sequences(apps, schema_editor):
+    Project = apps.get_model('hub', 'Project')
+    Issue = apps.get_model('hub', 'Issue')
+    Epic = apps.get_model('hub', 'Epic')
+    ProjectKeySequence = apps.get_model('hub', 'ProjectKeySequence')
+    ProjectKeySequence.objects.bulk_create([
+        ProjectKeySequence(
+            project_id=pk,
+            next_issue_number=_next_number(Issue.objects.filter(project_id=pk).values_list('key', flat=True), 101),
+            next_epic_number=_next_number(Epic.objects.filter(project_id=pk).values_list('key', flat=True), 1),
+        )
+        for pk in Project.objects.values_list('pk', flat=True)
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hub', '0013_issue_render_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectKeySequence',
+            fields=[
+                ('project', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='key_sequence', serialize=False, to='hub.project')),
+                ('next_issue_number', models.PositiveIntegerField(default=101)),
+                ('next_epic_number', models.PositiveIntegerField(default=1)),
+            ],
+        ),
+        migrations.RunPython(create_key_sequences, migrations.RunPython.noop),
+    ]
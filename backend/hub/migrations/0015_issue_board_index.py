@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:04
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hub', '0014_projectkeysequence'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(fields=['project', 'status', '-updated_at', '-id'], name='hub_issue_board_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:13
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hub', '0016_issuetransition'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SprintRollup',
+            fields=[
+                ('sprint', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='rollup', serialize=False, to='hub.sprint')),
+                ('committed', models.PositiveIntegerField(default=0)),
+                ('completed', models.PositiveIntegerField(default=0)),
+                ('committed_hours', models.FloatField(default=0)),
+                ('completed_hours', models.FloatField(default=0)),
+                ('frozen_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:14
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def populate_counters(apps, schema_editor):
+    Issue = apps.get_model('hub', 'Issue')
+    SprintIssueCounter = apps.get_model('hub', 'SprintIssueCounter')
+    rows = Issue.objects.filter(sprint__isnull=False).order_by().values_list('sprint_id', 'status', 'assignee_id').annotate(total=Count('id'))
+    SprintIssueCounter.objects.bulk_create(
+        [
+            SprintIssueCounter(sprint_id=sprint_id, status=status, assignee_id=assignee_id, count=total)
+            for sprint_id, status, assignee_id, total in rows
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hub', '0017_sprintrollup'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SprintIssueCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('todo', 'To Do'), ('in_progress', 'In Progress'), ('in_review', 'In Review'), ('done', 'Done')], max_length=16)),
+                ('count', models.IntegerField(default=0)),
+                ('assignee', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('sprint', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='issue_counters', to='hub.sprint')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('sprint', 'status', 'assignee'), name='hub_counter_assigned_uniq'), models.UniqueConstraint(condition=models.Q(('assignee__isnull', True)), fields=('sprint', 'status'), name='hub_counter_unassigned_uniq')],
+            },
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:24
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def seed_counters(apps, schema_editor):
+    Notification = apps.get_model('hub', 'Notification')
+    NotificationCounter = apps.get_model('hub', 'NotificationCounter')
+    unread = Notification.objects.filter(is_read=False).order_by().values_list('user_id').annotate(total=Count('id'))
+    NotificationCounter.objects.bulk_create(
+        [NotificationCounter(user_id=user_id, unread=total) for user_id, total in unread],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('hub', '0018_sprintissuecounter'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationCounter',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='notification_counter', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('unread', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(seed_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,44 @@
+from django.db import migrations
+
+
+def backfill_rollups(apps, schema_editor):
+    Issue = apps.get_model('hub', 'Issue')
+    IssueTransition = apps.get_model('hub', 'IssueTransition')
+    Sprint = apps.get_model('hub', 'Sprint')
+    SprintRollup = apps.get_model('hub', 'SprintRollup')
+    sprint_ids = list(Sprint.objects.filter(status='completed', rollup__isnull=True).values_list('id', flat=True))
+    if not sprint_ids:
+        return
+    members = {pk: {} for pk in sprint_ids}
+    history = (
+        IssueTransition.objects.filter(sprint_id__in=sprint_ids)
+        .order_by('created_at', 'id')
+        .values_list('sprint_id', 'issue_id', 'estimated_hours')
+    )
+    for sprint_id, issue_id, hours in history:
+        members[sprint_id][issue_id] = (False, hours)
+    current = Issue.objects.filter(sprint_id__in=sprint_ids).values_list('sprint_id', 'id', 'status', 'estimated_hours')
+    for sprint_id, issue_id, status, hours in current:
+        members[sprint_id][issue_id] = (status == 'done', hours)
+    rollups = []
+    for sprint_id, issues in members.items():
+        done = [hours for completed, hours in issues.values() if completed]
+        rollups.append(SprintRollup(
+            sprint_id=sprint_id,
+            committed=len(issues),
+            completed=len(done),
+            committed_hours=sum(hours or 0 for _, hours in issues.values()),
+            completed_hours=sum(hours or 0 for hours in done),
+        ))
+    SprintRollup.objects.bulk_create(rollups, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hub', '0021_notification_inbox_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_rollups, migrations.RunPython.noop),
+    ]
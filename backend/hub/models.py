@@ -1,6 +1,7 @@
 import uuid
 from django.conf import settings
 from django.db import models
+from django.utils import timezone
 
 
 class TimeStampedModel(models.Model):
@@ -111,6 +112,44 @@ class Project(TimeStampedModel):
         return f"{self.key} - {self.name}"
 
 
+class ProjectVersion(models.Model):
+    project = models.OneToOneField(Project, primary_key=True, on_delete=models.CASCADE, related_name='change_version')
+    version = models.BigIntegerField(default=1)
+
+
+class ProjectKeySequence(models.Model):
+    project = models.OneToOneField(Project, primary_key=True, on_delete=models.CASCADE, related_name='key_sequence')
+    next_issue_number = models.PositiveIntegerField(default=101)
+    next_epic_number = models.PositiveIntegerField(default=1)
+
+
+class ProjectChange(models.Model):
+    ENTITY_ISSUE = 'issue'
+    ENTITY_COMMENT = 'comment'
+    ENTITY_SPRINT = 'sprint'
+    ENTITY_EPIC = 'epic'
+    ENTITY_LABEL = 'label'
+    ENTITY_CHOICES = [
+        (ENTITY_ISSUE, 'Issue'),
+        (ENTITY_COMMENT, 'Comment'),
+        (ENTITY_SPRINT, 'Sprint'),
+        (ENTITY_EPIC, 'Epic'),
+        (ENTITY_LABEL, 'Label'),
+    ]
+
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='changes')
+    version = models.BigIntegerField()
+    entity = models.CharField(max_length=16, choices=ENTITY_CHOICES)
+    uid = models.CharField(max_length=32)
+    deleted = models.BooleanField(default=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['project', 'version'], name='hub_change_project_version_idx'),
+        ]
+
+
 class ProjectOnboarding(TimeStampedModel):
     uid = models.CharField(max_length=32, unique=True, default=onboarding_uid)
     project = models.OneToOneField(Project, on_delete=models.CASCADE, related_name='onboarding')
@@ -218,6 +257,15 @@ class Sprint(TimeStampedModel):
     end_date = models.DateField()
 
 
+class SprintRollup(models.Model):
+    sprint = models.OneToOneField(Sprint, primary_key=True, on_delete=models.CASCADE, related_name='rollup')
+    committed = models.PositiveIntegerField(default=0)
+    completed = models.PositiveIntegerField(default=0)
+    committed_hours = models.FloatField(default=0)
+    completed_hours = models.FloatField(default=0)
+    frozen_at = models.DateTimeField(auto_now_add=True)
+
+
 class Issue(TimeStampedModel):
     TYPE_CHOICES = [
         ('story', 'Story'),
@@ -259,6 +307,55 @@ class Issue(TimeStampedModel):
     estimated_hours = models.FloatField(null=True, blank=True)
     logged_hours = models.FloatField(default=0)
     watchers = models.ManyToManyField(settings.AUTH_USER_MODEL, blank=True, related_name='watched_issues')
+    render_version = models.PositiveIntegerField(default=1)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['-updated_at', '-id'], name='hub_issue_recent_idx'),
+            models.Index(fields=['project', '-updated_at', '-id'], name='hub_issue_project_recent_idx'),
+            models.Index(fields=['project', 'status', '-updated_at', '-id'], name='hub_issue_board_idx'),
+        ]
+
+
+class SprintIssueCounter(models.Model):
+    sprint = models.ForeignKey(Sprint, on_delete=models.CASCADE, related_name='issue_counters')
+    status = models.CharField(max_length=16, choices=Issue.STATUS_CHOICES)
+    assignee = models.ForeignKey(settings.AUTH_USER_MODEL, null=True, blank=True, on_delete=models.CASCADE, related_name='+')
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['sprint', 'status', 'assignee'], name='hub_counter_assigned_uniq'),
+            models.UniqueConstraint(
+                fields=['sprint', 'status'],
+                condition=models.Q(assignee__isnull=True),
+                name='hub_counter_unassigned_uniq',
+            ),
+        ]
+
+
+class IssueTransition(models.Model):
+    CHANGE_BASELINE = 'baseline'
+    CHANGE_CREATED = 'created'
+    CHANGE_STATUS = 'status'
+    CHANGE_SPRINT = 'sprint'
+    CHANGE_ESTIMATE = 'estimate'
+    CHANGE_SPRINT_START = 'sprint_start'
+
+    issue = models.ForeignKey(Issue, on_delete=models.CASCADE, related_name='transitions')
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='issue_transitions')
+    actor = models.ForeignKey(settings.AUTH_USER_MODEL, null=True, blank=True, on_delete=models.SET_NULL, related_name='+')
+    changes = models.CharField(max_length=64)
+    status = models.CharField(max_length=16, choices=Issue.STATUS_CHOICES)
+    sprint = models.ForeignKey(Sprint, null=True, blank=True, on_delete=models.SET_NULL, related_name='+')
+    estimated_hours = models.FloatField(null=True, blank=True)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['issue', 'created_at', 'id'], name='hub_transition_issue_idx'),
+            models.Index(fields=['project', 'created_at', 'id'], name='hub_transition_project_idx'),
+        ]
 
 
 class IssueComment(models.Model):
@@ -315,10 +412,22 @@ class Notification(models.Model):
     is_read = models.BooleanField(default=False)
     action_url = models.CharField(max_length=255, blank=True, default='')
     metadata = models.JSONField(default=dict, blank=True)
+    coalesce_key = models.CharField(max_length=160, blank=True, default='')
+    occurrences = models.PositiveIntegerField(default=1)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', 'is_read', '-created_at'], name='hub_notification_inbox_idx'),
+            models.Index(fields=['user', '-created_at'], name='hub_notification_recent_idx'),
+            models.Index(fields=['user', 'coalesce_key', '-created_at'], name='hub_notification_coalesce_idx'),
+        ]
+
+
+class NotificationCounter(models.Model):
+    user = models.OneToOneField(settings.AUTH_USER_MODEL, primary_key=True, on_delete=models.CASCADE, related_name='notification_counter')
+    unread = models.PositiveIntegerField(default=0)
 
 
 class ChatRoom(TimeStampedModel):
@@ -0,0 +1,27 @@
+from collections import Counter, defaultdict
+
+from . import coalesce, fanout, unread
+from .models import Notification
+from .serializers import NotificationSerializer
+
+
+def store(notifications):
+    if not notifications:
+        return []
+    fresh, merged = coalesce.coalesce(notifications)
+    Notification.objects.bulk_create(fresh)
+    Notification.objects.bulk_update(merged, coalesce.MERGED_FIELDS)
+    unread.adjust(Counter(notification.user_id for notification in fresh))
+    by_user = defaultdict(list)
+    for notification in [*merged, *fresh]:
+        by_user[notification.user_id].append(notification)
+    unread_counts = unread.counts(by_user)
+    return [
+        fanout.notification_event(
+            user_id,
+            'created',
+            unread_counts[user_id],
+            notifications=list(NotificationSerializer(rows, many=True).data),
+        )
+        for user_id, rows in by_user.items()
+    ]
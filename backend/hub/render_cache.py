@@ -0,0 +1,92 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F, Q
+
+from .models import Issue
+from .serializers import IssueSerializer
+
+CACHE_PREFIX = 'issue-render'
+HITS_KEY = f'{CACHE_PREFIX}:stats:hits'
+MISSES_KEY = f'{CACHE_PREFIX}:stats:misses'
+ROW_VERSION_FIELDS = ('id', 'updated_at', 'render_version')
+
+
+def cache_key(issue_id, updated_at, render_version):
+    return f'{CACHE_PREFIX}:{issue_id}:{int(updated_at.timestamp() * 1_000_000)}:{render_version}'
+
+
+def row_version(issue_id, updated_at, render_version):
+    return f'{issue_id}.{int(updated_at.timestamp() * 1_000_000)}.{render_version}'
+
+
+def invalidate(issue_ids):
+    issue_ids = [pk for pk in issue_ids if pk]
+    if issue_ids:
+        Issue.objects.filter(pk__in=issue_ids).update(render_version=F('render_version') + 1)
+
+
+def invalidate_for_user(user_id):
+    issues = Issue.objects.filter(
+        Q(assignee_id=user_id)
+        | Q(reporter_id=user_id)
+        | Q(watchers__id=user_id)
+        | Q(comments__author_id=user_id)
+        | Q(attachments__uploaded_by_id=user_id)
+    )
+    invalidate(set(issues.values_list('id', flat=True)))
+
+
+def _count(name, amount):
+    if not amount:
+        return
+    cache.add(name, 0, timeout=None)
+    try:
+        cache.incr(name, amount)
+    except ValueError:
+        cache.set(name, amount, timeout=None)
+
+
+def stats():
+    values = cache.get_many([HITS_KEY, MISSES_KEY])
+    hits = values.get(HITS_KEY, 0)
+    misses = values.get(MISSES_KEY, 0)
+    total = hits + misses
+    return {'hits': hits, 'misses': misses, 'hitRate': round(hits / total, 4) if total else None}
+
+
+def _absolutize(payload, request):
+    if not request or not payload.get('attachments'):
+        return payload
+    return {
+        **payload,
+        'attachments': [
+            {**attachment, 'fileUrl': request.build_absolute_uri(attachment['fileUrl'])}
+            for attachment in payload['attachments']
+        ],
+    }
+
+
+def render_issues(rows, load_issues, request=None):
+    rows = list(rows)
+    keys = [cache_key(*row) for row in rows]
+    cached = cache.get_many(keys)
+    missing_ids = [row[0] for row, key in zip(rows, keys) if key not in cached]
+
+    fresh_by_id = {}
+    if missing_ids:
+        fresh = {}
+        for issue in load_issues(missing_ids):
+            payload = IssueSerializer(issue).data
+            fresh_by_id[issue.id] = payload
+            fresh[cache_key(issue.id, issue.updated_at, issue.render_version)] = payload
+        cache.set_many(fresh, timeout=settings.ISSUE_RENDER_CACHE_TIMEOUT)
+
+    _count(HITS_KEY, len(keys) - len(missing_ids))
+    _count(MISSES_KEY, len(missing_ids))
+
+    payloads = []
+    for row, key in zip(rows, keys):
+        payload = cached.get(key) or fresh_by_id.get(row[0])
+        if payload is not None:
+            payloads.append(_absolutize(payload, request))
+    return payloads
@@ -0,0 +1,128 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils import timezone
+from django.utils.connection import ConnectionProxy
+
+from . import counters, flow, rollups, transitions
+from .models import Sprint
+from .versioning import current_version
+
+CACHE_PREFIX = 'report'
+POLL_INTERVAL = 0.05
+FLOW_REPORTS = {
+    'cycle-time': (flow.cycle_time, flow.CYCLE_TIME_DAYS),
+    'lead-time': (flow.lead_time, flow.LEAD_TIME_DAYS),
+    'throughput': (flow.throughput, flow.THROUGHPUT_WEEKS),
+    'cumulative-flow': (flow.cumulative_flow, flow.CUMULATIVE_FLOW_DAYS),
+}
+_MISSING = object()
+cache = ConnectionProxy(caches, 'reports')
+_flights = {}
+_flights_lock = threading.Lock()
+
+
+def cache_key(report: str, project_id, version, params=None) -> str:
+    digest = hashlib.sha1(json.dumps(params or {}, sort_keys=True, default=str).encode()).hexdigest()[:16]
+    return f'{CACHE_PREFIX}:{report}:{project_id}:{version}:{digest}'
+
+
+@contextmanager
+def _single_flight(key):
+    with _flights_lock:
+        flight = _flights.setdefault(key, [threading.Lock(), 0])
+        flight[1] += 1
+    try:
+        with flight[0]:
+            yield
+    finally:
+        with _flights_lock:
+            flight[1] -= 1
+            if not flight[1]:
+                _flights.pop(key, None)
+
+
+def _lock_path(key) -> Path:
+    return Path(settings.REPORT_CACHE_LOCK_DIR) / hashlib.sha1(key.encode()).hexdigest()
+
+
+def _acquire(path: Path) -> bool:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+        return True
+    except FileExistsError:
+        pass
+    try:
+        if time.time() - path.stat().st_mtime > settings.REPORT_CACHE_LOCK_TIMEOUT:
+            path.unlink(missing_ok=True)
+    except FileNotFoundError:
+        pass
+    return False
+
+
+def _fill(key, compute):
+    lock = _lock_path(key)
+    deadline = time.monotonic() + settings.REPORT_CACHE_LOCK_TIMEOUT
+    locked = _acquire(lock)
+    while not locked and time.monotonic() < deadline:
+        time.sleep(POLL_INTERVAL)
+        value = cache.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        locked = _acquire(lock)
+    try:
+        value = compute()
+        cache.set(key, value, timeout=settings.REPORT_CACHE_TIMEOUT)
+        return value
+    finally:
+        if locked:
+            lock.unlink(missing_ok=True)
+
+
+def cached(report: str, project_id, params, compute):
+    key = cache_key(report, project_id, current_version(project_id), params)
+    value = cache.get(key, _MISSING)
+    if value is not _MISSING:
+        return value
+    with _single_flight(key):
+        value = cache.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        return _fill(key, compute)
+
+
+def dashboard(project):
+    return cached('dashboard', project.id, None, lambda: counters.dashboard_stats(project))
+
+
+def velocity(project):
+    return cached('velocity', project.id, None, lambda: rollups.velocity(project))
+
+
+def burndown(sprint):
+    return cached('burndown', sprint.project_id, {'sprint': sprint.id}, lambda: transitions.burndown(sprint))
+
+
+def flow_report(report: str, project_id, window: int):
+    build = FLOW_REPORTS[report][0]
+    params = {'window': window, 'day': timezone.localdate()}
+    return cached(report, project_id, params, lambda: build(flow.load_history(project_id), window))
+
+
+def precompute(project):
+    dashboard(project)
+    velocity(project)
+    sprints = list(Sprint.objects.filter(project=project).exclude(status=Sprint.STATUS_COMPLETED))
+    for sprint in sprints:
+        burndown(sprint)
+    for report, (_, window) in FLOW_REPORTS.items():
+        flow_report(report, project.id, window)
+    return 2 + len(sprints) + len(FLOW_REPORTS)
@@ -0,0 +1,69 @@
+from django.db.models import Count, Q, Sum
+
+from .models import Issue, Sprint, SprintRollup
+
+DONE = Q(status='done')
+
+
+def sprint_totals(sprint_ids):
+    sprint_ids = list(sprint_ids)
+    if not sprint_ids:
+        return {}
+    rows = (
+        Issue.objects.filter(sprint_id__in=sprint_ids)
+        .order_by()
+        .values('sprint_id')
+        .annotate(
+            committed=Count('id'),
+            completed=Count('id', filter=DONE),
+            committed_hours=Sum('estimated_hours'),
+            completed_hours=Sum('estimated_hours', filter=DONE),
+        )
+    )
+    return {
+        row['sprint_id']: {
+            'committed': row['committed'],
+            'completed': row['completed'],
+            'committed_hours': row['committed_hours'] or 0,
+            'completed_hours': row['completed_hours'] or 0,
+        }
+        for row in rows
+    }
+
+
+def freeze(sprint_ids):
+    sprint_ids = list(sprint_ids)
+    totals = sprint_totals(sprint_ids)
+    SprintRollup.objects.filter(sprint_id__in=sprint_ids).delete()
+    SprintRollup.objects.bulk_create([SprintRollup(sprint_id=pk, **totals.get(pk, {})) for pk in sprint_ids])
+
+
+def thaw(sprint_ids):
+    SprintRollup.objects.filter(sprint_id__in=list(sprint_ids)).delete()
+
+
+def velocity(project):
+    sprints = list(Sprint.objects.filter(project=project).select_related('rollup').order_by('start_date'))
+    frozen = {}
+    for sprint in sprints:
+        rollup = getattr(sprint, 'rollup', None)
+        if rollup:
+            frozen[sprint.id] = {
+                'committed': rollup.committed,
+                'completed': rollup.completed,
+                'committed_hours': rollup.committed_hours,
+                'completed_hours': rollup.completed_hours,
+            }
+    live = sprint_totals(sprint.id for sprint in sprints if sprint.id not in frozen)
+    payload = []
+    for sprint in sprints:
+        totals = frozen.get(sprint.id) or live.get(sprint.id) or {}
+        payload.append({
+            'sprint': sprint.name,
+            'sprintId': sprint.uid,
+            'committed': totals.get('committed', 0),
+            'completed': totals.get('completed', 0),
+            'committedHours': totals.get('committed_hours', 0),
+            'completedHours': totals.get('completed_hours', 0),
+        })
+    return payload
@@ -0,0 +1,144 @@
+import re
+
+from django.db import connection
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+from .models import Epic, Issue, IssueComment
+
+SEARCH_TABLE = 'hub_search_index'
+KIND_ISSUE = 'issue'
+KIND_COMMENT = 'comment'
+KIND_EPIC = 'epic'
+KIND_OFFSETS = {KIND_ISSUE: 0, KIND_COMMENT: 1, KIND_EPIC: 2}
+TOKEN_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+
+def is_available():
+    return connection.vendor == 'sqlite'
+
+
+def _rowid(kind: str, pk: int) -> int:
+    return pk * 4 + KIND_OFFSETS[kind]
+
+
+def match_query(text: str):
+    tokens = TOKEN_PATTERN.findall(text or '')
+    if not tokens:
+        return None
+    return ' '.join(f'"{token}"*' for token in tokens)
+
+
+def _replace(kind: str, pk: int, key: str, title: str, body: str, issue_id, project_id):
+    rowid = _rowid(kind, pk)
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {SEARCH_TABLE} WHERE rowid = %s', [rowid])
+        cursor.execute(
+            f'INSERT INTO {SEARCH_TABLE} (rowid, key, title, body, kind, issue_id, project_id) VALUES (%s, %s, %s, %s, %s, %s, %s)',
+            [rowid, key, title, body, kind, issue_id, project_id],
+        )
+
+
+def index_issue(issue: Issue):
+    if is_available():
+        _replace(KIND_ISSUE, issue.pk, issue.key, issue.title, issue.description, issue.pk, issue.project_id)
+
+
+def index_issues(issues):
+    if not is_available() or not issues:
+        return
+    rows = [
+        (_rowid(KIND_ISSUE, issue.pk), issue.key, issue.title, issue.description, KIND_ISSUE, issue.pk, issue.project_id)
+        for issue in issues
+    ]
+    with connection.cursor() as cursor:
+        cursor.executemany(f'DELETE FROM {SEARCH_TABLE} WHERE rowid = %s', [row[:1] for row in rows])
+        cursor.executemany(
+            f'INSERT INTO {SEARCH_TABLE} (rowid, key, title, body, kind, issue_id, project_id) VALUES (%s, %s, %s, %s, %s, %s, %s)',
+            rows,
+        )
+
+
+def index_comment(comment: IssueComment):
+    if is_available():
+        _replace(KIND_COMMENT, comment.pk, '', '', comment.content, comment.issue_id, comment.issue.project_id)
+
+
+def index_epic(epic: Epic):
+    if is_available():
+        _replace(KIND_EPIC, epic.pk, epic.key, epic.name, epic.summary, None, epic.project_id)
+
+
+def remove(kind: str, pk: int):
+    if not is_available():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {SEARCH_TABLE} WHERE rowid = %s', [_rowid(kind, pk)])
+
+
+def rebuild():
+    issue_table = Issue._meta.db_table
+    comment_table = IssueComment._meta.db_table
+    epic_table = Epic._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {SEARCH_TABLE}')
+        cursor.execute(
+            f"INSERT INTO {SEARCH_TABLE} (rowid, key, title, body, kind, issue_id, project_id) "
+            f"SELECT id * 4, key, title, description, '{KIND_ISSUE}', id, project_id FROM {issue_table}"
+        )
+        cursor.execute(
+            f"INSERT INTO {SEARCH_TABLE} (rowid, key, title, body, kind, issue_id, project_id) "
+            f"SELECT c.id * 4 + 1, '', '', c.content, '{KIND_COMMENT}', c.issue_id, i.project_id "
+            f"FROM {comment_table} c INNER JOIN {issue_table} i ON i.id = c.issue_id"
+        )
+        cursor.execute(
+            f"INSERT INTO {SEARCH_TABLE} (rowid, key, title, body, kind, issue_id, project_id) "
+            f"SELECT id * 4 + 2, key, name, summary, '{KIND_EPIC}', NULL, project_id FROM {epic_table}"
+        )
+        cursor.execute(f"INSERT INTO {SEARCH_TABLE} ({SEARCH_TABLE}) VALUES ('optimize')")
+        cursor.execute(f'SELECT COUNT(*) FROM {SEARCH_TABLE}')
+        return cursor.fetchone()[0]
+
+
+def issue_filter(text: str):
+    query = match_query(text)
+    if not is_available():
+        return Q(title__icontains=text) | Q(key__icontains=text)
+    if not query:
+        return Q(pk__in=[])
+    return Q(pk__in=RawSQL(
+        f"SELECT issue_id FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s AND kind IN ('{KIND_ISSUE}', '{KIND_COMMENT}')",
+        [query],
+    ))
+
+
+def search(text: str, project_id=None, limit: int = 20):
+    query = match_query(text)
+    if not query or not is_available():
+        return [], []
+
+    sql = (
+        f"SELECT rowid, kind, issue_id, bm25({SEARCH_TABLE}, 10.0, 5.0, 1.0) AS rank, "
+        f"snippet({SEARCH_TABLE}, -1, '<mark>', '</mark>', '…', 12) "
+        f"FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s"
+    )
+    params = [query]
+    if project_id is not None:
+        sql += ' AND project_id = %s'
+        params.append(project_id)
+    sql += ' ORDER BY rank LIMIT %s'
+    params.append(limit * 4)
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+
+    issue_hits = {}
+    epic_hits = []
+    for rowid, kind, issue_id, rank, snippet in rows:
+        if kind == KIND_EPIC:
+            if len(epic_hits) < limit:
+                epic_hits.append({'epic_id': rowid // 4, 'rank': rank, 'snippet': snippet})
+        elif issue_id not in issue_hits and len(issue_hits) < limit:
+            issue_hits[issue_id] = {'issue_id': issue_id, 'kind': kind, 'rank': rank, 'snippet': snippet}
+    return list(issue_hits.values()), epic_hits
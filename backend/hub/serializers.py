@@ -143,6 +143,19 @@ class AttachmentSerializer(serializers.ModelSerializer):
         return obj.file.url
 
 
+ISSUE_EXPANDABLE_FIELDS = ['comments', 'links', 'watchers', 'attachments']
+ISSUE_SUMMARY_FIELDS = [
+    'id', 'key', 'title', 'type', 'status', 'priority',
+    'assigneeId', 'reporterId', 'labels', 'sprintId', 'epicId',
+    'parentId', 'createdAt', 'updatedAt', 'dueDate', 'timeTracking',
+    'watchers',
+]
+BOARD_CARD_FIELDS = [
+    'id', 'key', 'title', 'type', 'status', 'priority',
+    'assigneeId', 'dueDate', 'timeTracking',
+]
+
+
 class IssueSerializer(serializers.ModelSerializer):
     id = serializers.CharField(source='uid', read_only=True)
     type = serializers.CharField(source='issue_type')
@@ -171,6 +184,12 @@ class IssueSerializer(serializers.ModelSerializer):
             'attachments',
         ]
 
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
     def get_assigneeId(self, obj):
         return _user_uid(obj.assignee)
 
@@ -244,11 +263,12 @@ class NotificationSerializer(serializers.ModelSerializer):
     type = serializers.CharField(source='notification_type', read_only=True)
     isRead = serializers.BooleanField(source='is_read', read_only=True)
     actionUrl = serializers.CharField(source='action_url', read_only=True)
+    count = serializers.IntegerField(source='occurrences', read_only=True)
     createdAt = serializers.DateTimeField(source='created_at', read_only=True)
 
     class Meta:
         model = Notification
-        fields = ['id', 'title', 'message', 'type', 'isRead', 'actionUrl', 'metadata', 'createdAt']
+        fields = ['id', 'title', 'message', 'type', 'isRead', 'actionUrl', 'metadata', 'count', 'createdAt']
 
 
 class ChatParticipantSerializer(serializers.ModelSerializer):
@@ -0,0 +1,108 @@
+import atexit
+import logging
+import queue
+import threading
+import time
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+
+from . import fanout, notifications
+
+logger = logging.getLogger(__name__)
+
+KIND_NOTIFY = 'notify'
+KIND_SEND = 'send'
+
+_pending = queue.Queue(maxsize=settings.SIDE_EFFECT_QUEUE_SIZE)
+_lock = threading.Lock()
+_worker = None
+
+
+def _take(limit):
+    batch = []
+    while len(batch) < limit:
+        try:
+            batch.append(_pending.get_nowait())
+        except queue.Empty:
+            break
+    return batch
+
+
+def _deliver(batch):
+    started = time.perf_counter()
+    rows = [row for kind, items in batch if kind == KIND_NOTIFY for row in items]
+    messages = [message for kind, items in batch if kind == KIND_SEND for message in items]
+    try:
+        with transaction.atomic():
+            messages = notifications.store(rows) + messages
+    except Exception:
+        logger.exception('failed to store %d deferred notifications', len(rows))
+    try:
+        fanout.send(messages)
+    except Exception:
+        logger.exception('failed to send %d deferred channel messages', len(messages))
+    logger.info(
+        'side-effect batch: %d items, %d notifications, %d messages in %.2f ms',
+        len(batch), len(rows), len(messages), (time.perf_counter() - started) * 1000,
+    )
+
+
+def _drain():
+    while True:
+        batch = [_pending.get()]
+        batch += _take(settings.SIDE_EFFECT_BATCH_SIZE - 1)
+        try:
+            close_old_connections()
+            _deliver(batch)
+        finally:
+            for _ in batch:
+                _pending.task_done()
+
+
+def _start_worker():
+    global _worker
+    with _lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(target=_drain, name='side-effects', daemon=True)
+            _worker.start()
+
+
+def _enqueue(item):
+    if settings.SIDE_EFFECT_QUEUE_SIZE <= 0:
+        _deliver([item])
+        return
+    _start_worker()
+    try:
+        _pending.put_nowait(item)
+    except queue.Full:
+        logger.warning('side-effect queue full (%d items); delivering inline', _pending.qsize())
+        _deliver([item])
+
+
+def _defer(kind, items):
+    items = list(items)
+    if items:
+        transaction.on_commit(lambda: _enqueue((kind, items)))
+
+
+def notify(rows):
+    _defer(KIND_NOTIFY, rows)
+
+
+def send(messages):
+    _defer(KIND_SEND, messages)
+
+
+def flush(timeout: float = 10.0) -> bool:
+    deadline = time.monotonic() + timeout
+    with _pending.all_tasks_done:
+        while _pending.unfinished_tasks:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            _pending.all_tasks_done.wait(remaining)
+    return True
+
+
+atexit.register(lambda: flush(settings.SIDE_EFFECT_SHUTDOWN_TIMEOUT))
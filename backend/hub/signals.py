@@ -1,7 +1,23 @@
+from collections import Counter
+
 from django.contrib.auth import get_user_model
-from django.db.models.signals import post_save
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
 from django.dispatch import receiver
-from .models import UserProfile
+from .models import (
+    Epic,
+    Issue,
+    IssueAttachment,
+    IssueComment,
+    IssueLink,
+    Label,
+    Project,
+    ProjectChange,
+    ProjectVersion,
+    Sprint,
+    UserProfile,
+)
+from . import counters, render_cache, search
+from .versioning import record_changes, record_issue_changes
 
 
 @receiver(post_save, sender=get_user_model())
@@ -10,3 +26,190 @@ def ensure_profile(sender, instance, created, **kwargs):
         UserProfile.objects.create(user=instance)
     else:
         UserProfile.objects.get_or_create(user=instance)
+
+
+@receiver(post_save, sender=Project)
+def ensure_project_version(sender, instance, created, **kwargs):
+    if created:
+        ProjectVersion.objects.get_or_create(project=instance)
+
+
+PROJECT_ROW_ENTITIES = {
+    Issue: ProjectChange.ENTITY_ISSUE,
+    Sprint: ProjectChange.ENTITY_SPRINT,
+    Epic: ProjectChange.ENTITY_EPIC,
+    Label: ProjectChange.ENTITY_LABEL,
+}
+
+
+def _deleted_with(origin, *models):
+    return isinstance(origin, models) or getattr(origin, 'model', None) in models
+
+
+def _issue_keys(instance):
+    if type(instance).issue.is_cached(instance):
+        return instance.issue.project_id, instance.issue.uid
+    return Issue.objects.filter(pk=instance.issue_id).values_list('project_id', 'uid').first()
+
+
+@receiver(post_save, sender=Issue)
+@receiver(post_save, sender=Sprint)
+@receiver(post_save, sender=Epic)
+@receiver(post_save, sender=Label)
+def record_project_row_saved(sender, instance, **kwargs):
+    record_changes(instance.project_id, PROJECT_ROW_ENTITIES[sender], [instance.uid])
+
+
+@receiver(post_delete, sender=Issue)
+@receiver(post_delete, sender=Sprint)
+@receiver(post_delete, sender=Epic)
+@receiver(post_delete, sender=Label)
+def record_project_row_deleted(sender, instance, origin=None, **kwargs):
+    if _deleted_with(origin, Project):
+        return
+    record_changes(instance.project_id, PROJECT_ROW_ENTITIES[sender], [instance.uid], deleted=True)
+
+
+@receiver(post_save, sender=IssueComment)
+def record_comment_saved(sender, instance, **kwargs):
+    keys = _issue_keys(instance)
+    if keys:
+        record_changes(keys[0], ProjectChange.ENTITY_COMMENT, [instance.uid])
+
+
+@receiver(post_delete, sender=IssueComment)
+def record_comment_deleted(sender, instance, origin=None, **kwargs):
+    if _deleted_with(origin, Project, Issue):
+        return
+    keys = _issue_keys(instance)
+    if keys:
+        record_changes(keys[0], ProjectChange.ENTITY_COMMENT, [instance.uid], deleted=True)
+
+
+@receiver(post_save, sender=IssueAttachment)
+@receiver(post_save, sender=IssueLink)
+@receiver(post_delete, sender=IssueAttachment)
+@receiver(post_delete, sender=IssueLink)
+def record_issue_child_changed(sender, instance, origin=None, **kwargs):
+    if _deleted_with(origin, Project) or (sender is IssueAttachment and _deleted_with(origin, Issue)):
+        return
+    if isinstance(origin, Issue) and origin.pk == instance.issue_id:
+        return
+    keys = _issue_keys(instance)
+    if keys:
+        record_changes(keys[0], ProjectChange.ENTITY_ISSUE, [keys[1]])
+
+
+@receiver(m2m_changed, sender=Issue.labels.through)
+@receiver(m2m_changed, sender=Issue.watchers.through)
+def record_issue_m2m_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        record_changes(instance.project_id, ProjectChange.ENTITY_ISSUE, [instance.uid])
+    elif pk_set:
+        record_issue_changes(Issue.objects.filter(pk__in=pk_set))
+
+
+@receiver(post_save, sender=Issue)
+def index_issue(sender, instance, **kwargs):
+    search.index_issue(instance)
+
+
+@receiver(post_save, sender=IssueComment)
+def index_comment(sender, instance, **kwargs):
+    search.index_comment(instance)
+
+
+@receiver(post_save, sender=Epic)
+def index_epic(sender, instance, **kwargs):
+    search.index_epic(instance)
+
+
+@receiver(post_delete, sender=Issue)
+def unindex_issue(sender, instance, **kwargs):
+    search.remove(search.KIND_ISSUE, instance.pk)
+
+
+@receiver(post_delete, sender=IssueComment)
+def unindex_comment(sender, instance, **kwargs):
+    search.remove(search.KIND_COMMENT, instance.pk)
+
+
+@receiver(post_delete, sender=Epic)
+def unindex_epic(sender, instance, **kwargs):
+    search.remove(search.KIND_EPIC, instance.pk)
+
+
+@receiver(post_save, sender=IssueComment)
+@receiver(post_save, sender=IssueAttachment)
+@receiver(post_save, sender=IssueLink)
+@receiver(post_delete, sender=IssueComment)
+@receiver(post_delete, sender=IssueAttachment)
+@receiver(post_delete, sender=IssueLink)
+def invalidate_issue_render(sender, instance, origin=None, **kwargs):
+    if _deleted_with(origin, Project, Issue) and sender is not IssueLink:
+        return
+    render_cache.invalidate([instance.issue_id])
+
+
+@receiver(m2m_changed, sender=Issue.labels.through)
+@receiver(m2m_changed, sender=Issue.watchers.through)
+def invalidate_issue_render_m2m(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        render_cache.invalidate([instance.pk])
+    elif pk_set:
+        render_cache.invalidate(pk_set)
+
+
+@receiver(pre_delete, sender=Label)
+def invalidate_issue_render_for_label(sender, instance, origin=None, **kwargs):
+    if _deleted_with(origin, Project):
+        return
+    issue_ids = list(instance.issues.values_list('pk', flat=True))
+    if issue_ids:
+        render_cache.invalidate(issue_ids)
+        record_issue_changes(Issue.objects.filter(pk__in=issue_ids))
+
+
+@receiver(post_save, sender=UserProfile)
+def invalidate_issue_render_for_profile(sender, instance, created, update_fields=None, **kwargs):
+    if created or update_fields is None or 'uid' in update_fields:
+        render_cache.invalidate_for_user(instance.user_id)
+
+
+@receiver(post_delete, sender=UserProfile)
+def invalidate_issue_render_for_deleted_profile(sender, instance, **kwargs):
+    render_cache.invalidate_for_user(instance.user_id)
+
+
+@receiver(pre_save, sender=Issue)
+def load_counter_state(sender, instance, raw=False, **kwargs):
+    if not raw and not instance._state.adding and getattr(instance, '_counter_state', None) is None:
+        instance._counter_state = counters.stored_state(instance.pk)
+
+
+@receiver(post_save, sender=Issue)
+def update_counters_on_save(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    after = counters.state(instance) or counters.stored_state(instance.pk)
+    if created:
+        counters.apply(Counter({after: 1}))
+    else:
+        counters.move([(getattr(instance, '_counter_state', None), after)])
+    instance._counter_state = None
+
+
+@receiver(post_delete, sender=Issue)
+def update_counters_on_delete(sender, instance, origin=None, **kwargs):
+    if _deleted_with(origin, Project, Sprint):
+        return
+    counters.apply(Counter({counters.state(instance): -1}))
+
+
+@receiver(pre_delete, sender=get_user_model())
+def release_assignee_counters(sender, instance, **kwargs):
+    counters.unassign_user(instance.pk)
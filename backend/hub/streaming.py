@@ -0,0 +1,74 @@
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+from rest_framework.settings import api_settings
+
+from .renderers import FastJSONRenderer, dumps
+
+STREAM_CHUNK_SIZE = 500
+JSON_CONTENT_TYPE = 'application/json'
+NDJSON_CONTENT_TYPE = 'application/x-ndjson'
+_DONE = object()
+
+
+class NDJSONRenderer(FastJSONRenderer):
+    media_type = NDJSON_CONTENT_TYPE
+    format = 'ndjson'
+
+
+class StreamingRendererMixin:
+    renderer_classes = [*api_settings.DEFAULT_RENDERER_CLASSES, NDJSONRenderer]
+
+
+def stream_format(request):
+    value = (request.query_params.get('stream') or '').lower()
+    if value in ('1', 'true', 'json'):
+        return JSON_CONTENT_TYPE
+    if value == 'ndjson' or getattr(request, 'accepted_media_type', None) == NDJSON_CONTENT_TYPE:
+        return NDJSON_CONTENT_TYPE
+    return None
+
+
+def _batches(rows, serialize, chunk_size):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= chunk_size:
+            yield serialize(batch)
+            batch = []
+    if batch:
+        yield serialize(batch)
+
+
+def _json_array(batches):
+    yield b'['
+    separator = b''
+    for items in batches:
+        if items:
+            yield separator + b','.join(dumps(item) for item in items)
+            separator = b','
+    yield b']'
+
+
+def _ndjson(batches):
+    for items in batches:
+        if items:
+            yield b''.join(dumps(item) + b'\n' for item in items)
+
+
+async def _iterate_async(iterator):
+    next_part = sync_to_async(next, thread_sensitive=True)
+    while True:
+        part = await next_part(iterator, _DONE)
+        if part is _DONE:
+            return
+        yield part
+
+
+def stream_response(request, queryset, serialize, content_type, chunk_size: int = STREAM_CHUNK_SIZE):
+    rows = queryset.iterator(chunk_size=chunk_size)
+    writer = _ndjson if content_type == NDJSON_CONTENT_TYPE else _json_array
+    body = writer(_batches(rows, serialize, chunk_size))
+    if isinstance(getattr(request, '_request', request), ASGIRequest):
+        body = _iterate_async(body)
+    return StreamingHttpResponse(body, content_type=content_type)
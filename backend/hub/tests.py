@@ -0,0 +1,1014 @@
+import asyncio
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from pathlib import Path
+from unittest import mock
+
+import msgpack
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from . import counters, fanout, flow, report_cache, search, side_effects, unread
+from .models import (
+    Issue,
+    IssueComment,
+    IssueLink,
+    IssueTransition,
+    Label,
+    Notification,
+    NotificationCounter,
+    Project,
+    ProjectChange,
+    Sprint,
+    SprintIssueCounter,
+    SprintRollup,
+    UserProfile,
+)
+from .keys import allocate_epic_keys, allocate_issue_keys
+from .uids import UidResolver
+
+TEST_CACHES = {
+    alias: {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': f'hub-tests-{alias}'}
+    for alias in ('default', 'reports')
+}
+
+
+@override_settings(CACHES=TEST_CACHES, SIDE_EFFECT_QUEUE_SIZE=0)
+class HubTestCase(TestCase):
+    def setUp(self):
+        for alias in TEST_CACHES:
+            caches[alias].clear()
+        self.user = get_user_model().objects.create_user('alex', 'alex@example.com', 'pw')
+        self.user.profile.role = UserProfile.ROLE_ADMIN
+        self.user.profile.save()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.project = Project.objects.create(name='Atlas', key='ATL', lead=self.user)
+        self.sprint = Sprint.objects.create(
+            project=self.project, name='Sprint 1', start_date=date(2026, 1, 1), end_date=date(2026, 1, 14)
+        )
+
+    def create_issue(self, **fields):
+        fields = {'title': 'Issue', 'issue_type': 'task', 'reporter': self.user, **fields}
+        return Issue.objects.create(project=self.project, key=f'ATL-{Issue.objects.count() + 1}', **fields)
+
+
+class CounterTests(HubTestCase):
+    def test_delete_project_with_sprint_issues(self):
+        self.create_issue(sprint=self.sprint)
+        self.create_issue(sprint=self.sprint, assignee=self.user, status='done')
+
+        response = self.client.delete(f'/api/projects/{self.project.uid}/')
+
+        self.assertEqual(response.status_code, 204)
+        self.assertFalse(Project.objects.exists())
+        self.assertFalse(SprintIssueCounter.objects.exists())
+        with connection.cursor() as cursor:
+            cursor.execute('PRAGMA foreign_key_check')
+            self.assertEqual(cursor.fetchall(), [])
+
+    def test_delete_issue_never_creates_negative_counter(self):
+        self.create_issue(sprint=self.sprint)
+        SprintIssueCounter.objects.all().delete()
+
+        Issue.objects.get().delete()
+
+        self.assertFalse(SprintIssueCounter.objects.exists())
+
+
+class BulkIssueTests(HubTestCase):
+    def bulk(self, *operations):
+        return self.client.post('/api/issues/bulk/', {'operations': list(operations)}, format='json')
+
+    def counter_snapshot(self):
+        return set(SprintIssueCounter.objects.filter(count__gt=0).values_list('sprint_id', 'status', 'assignee_id', 'count'))
+
+    def assert_counters_match_rebuild(self):
+        maintained = self.counter_snapshot()
+        counters.rebuild()
+        self.assertEqual(maintained, self.counter_snapshot())
+
+    def test_mixed_operations_keep_counters_consistent(self):
+        kept, moved, doomed = (self.create_issue(sprint=self.sprint) for _ in range(3))
+        assignee = self.user.profile.uid
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.bulk(
+                {'op': 'create', 'data': {'projectId': self.project.uid, 'title': 'New', 'type': 'task', 'sprintId': self.sprint.uid}},
+                {'op': 'update', 'id': kept.uid, 'data': {'assigneeId': assignee}},
+                {'op': 'move', 'id': moved.uid, 'status': 'done'},
+                {'op': 'delete', 'id': doomed.uid},
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([result['op'] for result in response.data['results']], ['create', 'update', 'move', 'delete'])
+        self.assertEqual(Issue.objects.get(pk=kept.pk).assignee, self.user)
+        self.assertEqual(Issue.objects.get(pk=moved.pk).status, 'done')
+        self.assertFalse(Issue.objects.filter(pk=doomed.pk).exists())
+        created = Issue.objects.get(uid=response.data['results'][0]['id'])
+        self.assertEqual(created.sprint, self.sprint)
+        self.assertNotIn(created.key, {kept.key, moved.key, doomed.key})
+        self.assertEqual(
+            self.counter_snapshot(),
+            {
+                (self.sprint.pk, 'todo', None, 1),
+                (self.sprint.pk, 'todo', self.user.pk, 1),
+                (self.sprint.pk, 'done', None, 1),
+            },
+        )
+        self.assert_counters_match_rebuild()
+
+    def test_update_then_delete_in_one_request(self):
+        issue = self.create_issue(sprint=self.sprint)
+
+        response = self.bulk(
+            {'op': 'move', 'id': issue.uid, 'status': 'in_progress'},
+            {'op': 'delete', 'id': issue.uid},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(Issue.objects.exists())
+        self.assertEqual(self.counter_snapshot(), set())
+        self.assert_counters_match_rebuild()
+
+    def test_invalid_operation_rolls_back_the_whole_request(self):
+        issue = self.create_issue(sprint=self.sprint)
+
+        response = self.bulk(
+            {'op': 'move', 'id': issue.uid, 'status': 'done'},
+            {'op': 'move', 'id': issue.uid, 'status': 'shipped'},
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data['errors'], [{'index': 1, 'detail': 'Invalid status'}])
+        self.assertEqual(Issue.objects.get().status, 'todo')
+        self.assert_counters_match_rebuild()
+
+
+class KeyAllocationTests(HubTestCase):
+    def test_sequence_starts_after_existing_keys(self):
+        Issue.objects.create(project=self.project, key='ATL-150', title='Imported', issue_type='task', reporter=self.user)
+
+        self.assertEqual(allocate_issue_keys(self.project, 2), ['ATL-151', 'ATL-152'])
+        self.assertEqual(allocate_epic_keys(self.project), ['ATL-E1'])
+
+    def test_api_and_bulk_creates_share_the_sequence(self):
+        created = self.client.post(
+            '/api/issues/', {'projectId': self.project.uid, 'title': 'One', 'type': 'task'}, format='json'
+        )
+        bulk = self.client.post('/api/issues/bulk/', {'operations': [
+            {'op': 'create', 'data': {'projectId': self.project.uid, 'title': 'Two', 'type': 'task'}},
+            {'op': 'create', 'data': {'projectId': self.project.uid, 'title': 'Three', 'type': 'task'}},
+        ]}, format='json')
+
+        keys = [created.data['key'], *(result['key'] for result in bulk.data['results'])]
+        self.assertEqual(keys, ['ATL-101', 'ATL-102', 'ATL-103'])
+
+
+@override_settings(CACHES=TEST_CACHES)
+class ConcurrentKeyAllocationTests(TransactionTestCase):
+    def test_concurrent_allocations_never_overlap(self):
+        user = get_user_model().objects.create_user('alex', 'alex@example.com', 'pw')
+        project = Project.objects.create(name='Atlas', key='ATL', lead=user)
+        ready = threading.Barrier(8)
+
+        def allocate(count):
+            ready.wait()
+            try:
+                return allocate_issue_keys(project, count)
+            finally:
+                connection.close()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            batches = list(pool.map(allocate, range(1, 9)))
+
+        keys = [key for batch in batches for key in batch]
+        self.assertEqual(sorted(keys), sorted(f'ATL-{number}' for number in range(101, 101 + len(keys))))
+        for batch in batches:
+            numbers = [int(key.split('-')[1]) for key in batch]
+            self.assertEqual(numbers, list(range(numbers[0], numbers[0] + len(numbers))))
+
+
+class RenderCacheTests(HubTestCase):
+    def get_issue(self, issue):
+        response = self.client.get(f'/api/issues/{issue.uid}/')
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def cache_stats(self):
+        return self.client.get('/api/reports/issue-cache/').data
+
+    def test_unchanged_issue_is_served_from_cache(self):
+        issue = self.create_issue()
+
+        first, second = self.get_issue(issue), self.get_issue(issue)
+
+        self.assertEqual(first, second)
+        self.assertEqual({key: self.cache_stats()[key] for key in ('hits', 'misses')}, {'hits': 1, 'misses': 1})
+
+    def test_related_writes_rerender_the_issue(self):
+        issue, target = self.create_issue(), self.create_issue()
+        label = Label.objects.create(project=self.project, name='backend')
+        watcher = get_user_model().objects.create_user('sam', 'sam@example.com', 'pw')
+        self.get_issue(issue)
+
+        comment = IssueComment.objects.create(issue=issue, author=self.user, content='Looks good')
+        self.assertEqual([c['content'] for c in self.get_issue(issue)['comments']], ['Looks good'])
+        comment.delete()
+        self.assertEqual(self.get_issue(issue)['comments'], [])
+        IssueLink.objects.create(issue=issue, link_type='blocks', target_issue=target)
+        self.assertEqual([link['targetIssueId'] for link in self.get_issue(issue)['links']], [target.uid])
+        label.issues.add(issue)
+        self.assertEqual(self.get_issue(issue)['labels'], [label.uid])
+        issue.watchers.add(watcher)
+        self.assertEqual(self.get_issue(issue)['watchers'], [watcher.profile.uid])
+
+    def test_profile_uid_change_rerenders_assigned_issues(self):
+        issue = self.create_issue(assignee=self.user)
+        listed = f'/api/issues/?project_id={self.project.uid}'
+        self.get_issue(issue)
+        self.client.get(listed)
+
+        profile = self.user.profile
+        profile.uid = 'u-renamed'
+        profile.save(update_fields=['uid'])
+
+        self.assertEqual(self.get_issue(issue)['assigneeId'], 'u-renamed')
+        self.assertEqual([row['assigneeId'] for row in self.client.get(listed).data], ['u-renamed'])
+
+    def test_deleting_a_label_rerenders_its_issues(self):
+        issue = self.create_issue()
+        label = Label.objects.create(project=self.project, name='backend')
+        issue.labels.add(label)
+        self.assertEqual(self.get_issue(issue)['labels'], [label.uid])
+        before = ProjectChange.objects.filter(uid=issue.uid).count()
+
+        label.delete()
+
+        self.assertEqual(self.get_issue(issue)['labels'], [])
+        self.assertEqual(ProjectChange.objects.filter(uid=issue.uid).count(), before + 1)
+
+
+class ReportCacheTests(HubTestCase):
+    def setUp(self):
+        super().setUp()
+        scratch = tempfile.TemporaryDirectory()
+        self.addCleanup(scratch.cleanup)
+        shared = {
+            **TEST_CACHES,
+            'reports': {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': f'{scratch.name}/reports'},
+        }
+        override = self.settings(CACHES=shared, REPORT_CACHE_LOCK_DIR=f'{scratch.name}/locks')
+        override.enable()
+        self.addCleanup(override.disable)
+
+    def test_concurrent_fills_compute_once(self):
+        calls = []
+        ready = threading.Barrier(8)
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.2)
+            return {'total': 3}
+
+        def fill(_):
+            ready.wait()
+            return report_cache._fill('report:dashboard:1:1:test', compute)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(fill, range(8)))
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{'total': 3}] * 8)
+
+    def test_only_one_contender_acquires_the_lock(self):
+        lock = report_cache._lock_path('report:dashboard:1:1:contended')
+        ready = threading.Barrier(32)
+
+        def acquire(_):
+            ready.wait()
+            return report_cache._acquire(lock)
+
+        with ThreadPoolExecutor(max_workers=32) as pool:
+            acquired = list(pool.map(acquire, range(32)))
+
+        self.assertEqual(acquired.count(True), 1)
+
+    def test_stale_lock_is_broken(self):
+        key = 'report:dashboard:1:1:stale'
+        lock = report_cache._lock_path(key)
+        lock.parent.mkdir(parents=True)
+        lock.touch()
+        old = time.time() - settings.REPORT_CACHE_LOCK_TIMEOUT - 1
+        os.utime(lock, (old, old))
+
+        self.assertEqual(report_cache._fill(key, lambda: 'fresh'), 'fresh')
+        self.assertFalse(lock.exists())
+
+
+class SprintTests(HubTestCase):
+    def test_completing_a_completed_sprint_keeps_its_rollup(self):
+        self.create_issue(sprint=self.sprint, status='done')
+        self.create_issue(sprint=self.sprint)
+        url = f'/api/sprints/{self.sprint.uid}/complete/'
+
+        self.assertEqual(self.client.post(url).status_code, 200)
+        response = self.client.post(url)
+
+        self.assertEqual(response.status_code, 400)
+        rollup = SprintRollup.objects.get(sprint=self.sprint)
+        self.assertEqual((rollup.committed, rollup.completed), (2, 1))
+
+    def test_failed_start_leaves_no_half_started_sprint(self):
+        self.sprint.status = Sprint.STATUS_ACTIVE
+        self.sprint.save()
+        self.create_issue(sprint=self.sprint)
+        upcoming = Sprint.objects.create(
+            project=self.project, name='Sprint 2', start_date=date(2026, 1, 15), end_date=date(2026, 1, 28)
+        )
+
+        with mock.patch('hub.views.transitions.record_sprint_start', side_effect=RuntimeError('boom')):
+            with self.assertRaises(RuntimeError):
+                self.client.post(f'/api/sprints/{upcoming.uid}/start/')
+
+        self.sprint.refresh_from_db()
+        upcoming.refresh_from_db()
+        self.assertEqual((self.sprint.status, upcoming.status), (Sprint.STATUS_ACTIVE, Sprint.STATUS_PLANNED))
+        self.assertFalse(SprintRollup.objects.exists())
+
+
+class UidResolverTests(HubTestCase):
+    def test_resolves_every_kind_in_one_query(self):
+        issue = self.create_issue()
+        resolver = UidResolver()
+
+        with self.assertNumQueries(1):
+            resolver.prime({
+                'user': [self.user.profile.uid],
+                'sprint': [self.sprint.uid],
+                'issue': [issue.uid, 'i-missing'],
+            })
+        with self.assertNumQueries(0):
+            self.assertEqual(resolver.pk('user', self.user.profile.uid), self.user.pk)
+            self.assertEqual(resolver.pk('sprint', self.sprint.uid), self.sprint.pk)
+            self.assertEqual(resolver.pks('issue', [issue.uid, 'i-missing']), [issue.pk])
+
+    def test_deleted_uid_is_not_resolved_by_a_later_request(self):
+        self.assertEqual(UidResolver().pk('sprint', self.sprint.uid), self.sprint.pk)
+        Sprint.objects.filter(pk=self.sprint.pk).delete()
+
+        self.assertIsNone(UidResolver().pk('sprint', self.sprint.uid))
+
+
+class VersioningTests(HubTestCase):
+    def add_comments(self, issue, count):
+        for n in range(count):
+            IssueComment.objects.create(issue=issue, author=self.user, content=f'Comment {n}')
+
+    def test_delete_project_with_comments_and_links(self):
+        issue = self.create_issue()
+        other = self.create_issue()
+        self.add_comments(issue, 2)
+        IssueLink.objects.create(issue=issue, link_type='blocks', target_issue=other)
+
+        response = self.client.delete(f'/api/projects/{self.project.uid}/')
+
+        self.assertEqual(response.status_code, 204)
+        self.assertFalse(ProjectChange.objects.exists())
+        with connection.cursor() as cursor:
+            cursor.execute('PRAGMA foreign_key_check')
+            self.assertEqual(cursor.fetchall(), [])
+
+    def test_issue_delete_does_not_query_per_comment(self):
+        few, many = self.create_issue(), self.create_issue()
+        self.add_comments(few, 1)
+        self.add_comments(many, 10)
+
+        with CaptureQueriesContext(connection) as few_queries:
+            few.delete()
+        with CaptureQueriesContext(connection) as many_queries:
+            many.delete()
+
+        selects = [
+            [query['sql'] for query in queries if query['sql'].startswith('SELECT')]
+            for queries in (few_queries, many_queries)
+        ]
+        self.assertEqual(len(selects[0]), len(selects[1]))
+
+    def test_link_removed_with_target_records_change_on_source(self):
+        source, target = self.create_issue(), self.create_issue()
+        IssueLink.objects.create(issue=source, link_type='blocks', target_issue=target)
+
+        target.delete()
+
+        self.assertTrue(ProjectChange.objects.filter(uid=source.uid, entity=ProjectChange.ENTITY_ISSUE).exists())
+
+
+class ConditionalGetTests(HubTestCase):
+    def get(self, url, etag=None, **headers):
+        if etag:
+            headers['HTTP_IF_NONE_MATCH'] = etag
+        return self.client.get(url, **headers)
+
+    def test_issue_list_revalidates_against_project_version(self):
+        issue = self.create_issue()
+        url = f'/api/issues/?project_id={self.project.uid}'
+        first = self.get(url)
+        etag = first['ETag']
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first['Cache-Control'], 'private, no-cache')
+        repeat = self.get(url, etag)
+        self.assertEqual((repeat.status_code, repeat['ETag']), (304, etag))
+        self.assertEqual(repeat.content, b'')
+
+        self.client.patch(f'/api/issues/{issue.uid}/', {'title': 'Renamed'}, format='json')
+
+        changed = self.get(url, etag)
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed['ETag'], etag)
+
+    def test_etag_varies_with_accept_and_query(self):
+        self.create_issue()
+        url = f'/api/issues/?project_id={self.project.uid}'
+        etag = self.get(url)['ETag']
+
+        self.assertEqual(self.get(url, etag, HTTP_ACCEPT='application/msgpack').status_code, 200)
+        self.assertEqual(self.get(f'{url}&status=done', etag).status_code, 200)
+
+    def test_issue_detail_revalidates_against_the_issue(self):
+        issue, other = self.create_issue(), self.create_issue()
+        url = f'/api/issues/{issue.uid}/'
+        etag = self.get(url)['ETag']
+
+        self.client.patch(f'/api/issues/{other.uid}/', {'title': 'Elsewhere'}, format='json')
+        self.assertEqual(self.get(url, etag).status_code, 304)
+
+        self.client.patch(url, {'title': 'Renamed'}, format='json')
+        changed = self.get(url, etag)
+        self.assertEqual(changed.status_code, 200)
+        self.assertEqual(changed.data['title'], 'Renamed')
+
+    def test_unknown_project_has_no_etag(self):
+        response = self.get('/api/issues/?project_id=p-missing', '*')
+
+        self.assertNotEqual(response.status_code, 304)
+        self.assertFalse(response.has_header('ETag'))
+
+
+class BoardTests(HubTestCase):
+    def setUp(self):
+        super().setUp()
+        self.todo = [self.create_issue() for _ in range(5)]
+        self.done = [self.create_issue(status='done', assignee=self.user) for _ in range(2)]
+        Issue.objects.filter(pk__in=[issue.pk for issue in self.todo[1:4]]).update(updated_at=timezone.now())
+
+    def board(self, **params):
+        response = self.client.get('/api/boards/', {'project_id': self.project.uid, **params})
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def ordered_keys(self, status):
+        return list(Issue.objects.filter(status=status).order_by('-updated_at', '-id').values_list('key', flat=True))
+
+    def test_columns_report_full_counts_and_first_page(self):
+        columns = {column['status']: column for column in self.board(limit=2)['columns']}
+
+        self.assertEqual({status: column['count'] for status, column in columns.items()}, {'todo': 5, 'in_progress': 0, 'in_review': 0, 'done': 2})
+        self.assertEqual([card['key'] for card in columns['todo']['cards']], self.ordered_keys('todo')[:2])
+        self.assertIsNotNone(columns['todo']['next'])
+        self.assertIsNone(columns['done']['next'])
+        self.assertEqual((columns['in_progress']['cards'], columns['in_progress']['next']), ([], None))
+
+    def test_counts_follow_filters(self):
+        columns = self.board(assignee_id=self.user.profile.uid)['columns']
+
+        self.assertEqual([column['count'] for column in columns], [0, 0, 0, 2])
+
+    def test_cursor_walks_a_column_without_gaps_or_repeats(self):
+        column = self.board(limit=2)['columns'][0]
+        keys = [card['key'] for card in column['cards']]
+        cursor = column['next']
+        pages = 1
+        while cursor:
+            page = self.board(status='todo', limit=2, cursor=cursor)
+            keys += [card['key'] for card in page['cards']]
+            cursor = page['next']
+            pages += 1
+
+        self.assertEqual(keys, self.ordered_keys('todo'))
+        self.assertEqual(pages, 3)
+
+    def test_invalid_cursor_and_status(self):
+        params = {'project_id': self.project.uid, 'status': 'todo', 'cursor': 'not-a-cursor'}
+        self.assertEqual(self.client.get('/api/boards/', params).status_code, 400)
+        params = {'project_id': self.project.uid, 'status': 'shipped'}
+        self.assertEqual(self.client.get('/api/boards/', params).status_code, 400)
+
+
+class ContentNegotiationTests(HubTestCase):
+    def test_msgpack_matches_json(self):
+        issue = self.create_issue(sprint=self.sprint, estimated_hours=2.5)
+        for url in (f'/api/issues/{issue.uid}/', f'/api/issues/?project_id={self.project.uid}'):
+            as_json = self.client.get(url)
+            as_msgpack = self.client.get(url, HTTP_ACCEPT='application/msgpack')
+
+            self.assertEqual(as_json['Content-Type'], 'application/json')
+            self.assertEqual(as_msgpack['Content-Type'], 'application/msgpack')
+            self.assertEqual(msgpack.unpackb(b''.join(as_msgpack), raw=False), json.loads(b''.join(as_json)))
+
+    def test_format_query_parameter_selects_msgpack(self):
+        response = self.client.get(f'/api/issues/?project_id={self.project.uid}&format=msgpack')
+
+        self.assertEqual(response['Content-Type'], 'application/msgpack')
+
+    def test_msgpack_request_body(self):
+        body = msgpack.packb({'projectId': self.project.uid, 'title': 'Packed', 'type': 'task'})
+
+        response = self.client.post('/api/issues/', body, content_type='application/msgpack')
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Issue.objects.get(uid=response.data['id']).title, 'Packed')
+
+    def test_malformed_bodies_are_rejected(self):
+        for body, content_type in (
+            (b'{"title": ', 'application/json'),
+            (b'\xff\xfe', 'application/json'),
+            (b'\xc1', 'application/msgpack'),
+            (b'\x82\xa5title', 'application/msgpack'),
+            (msgpack.packb({'title': 'x'}) + b'\x00', 'application/msgpack'),
+        ):
+            with self.subTest(body=body):
+                response = self.client.post('/api/issues/', body, content_type=content_type)
+                self.assertEqual(response.status_code, 400)
+        self.assertFalse(Issue.objects.exists())
+
+
+class BurndownTests(HubTestCase):
+    def at(self, day):
+        return datetime(2026, 1, 1 + day, 12, tzinfo=dt_timezone.utc)
+
+    def history(self, issue, *events):
+        IssueTransition.objects.bulk_create([
+            IssueTransition(
+                issue=issue,
+                project=self.project,
+                changes=IssueTransition.CHANGE_STATUS,
+                status=status,
+                sprint=sprint,
+                estimated_hours=issue.estimated_hours,
+                created_at=self.at(day),
+            )
+            for day, status, sprint in events
+        ])
+
+    def burndown(self):
+        response = self.client.get('/api/reports/burndown/', {'sprint_id': self.sprint.uid})
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_series_replays_transitions(self):
+        reopened = self.create_issue(sprint=self.sprint, status='done', estimated_hours=4)
+        removed = self.create_issue(estimated_hours=2)
+        added = self.create_issue(sprint=self.sprint, estimated_hours=3)
+        legacy = self.create_issue(sprint=self.sprint, status='done', estimated_hours=1)
+        Issue.objects.filter(pk=legacy.pk).update(created_at=self.at(0), updated_at=self.at(10))
+        self.history(reopened, (0, 'todo', self.sprint), (3, 'done', self.sprint), (5, 'in_progress', self.sprint), (8, 'done', self.sprint))
+        self.history(removed, (0, 'todo', self.sprint), (4, 'todo', None))
+        self.history(added, (6, 'todo', self.sprint))
+
+        series = self.burndown()
+
+        self.assertEqual(len(series), 14)
+        self.assertEqual(
+            [(point['remaining'], point['remainingHours']) for point in series],
+            [(3, 7.0)] * 3 + [(2, 3.0), (1, 1.0), (2, 5.0), (3, 8.0), (3, 8.0), (2, 4.0), (2, 4.0)] + [(1, 3.0)] * 4,
+        )
+        self.assertEqual((series[0]['ideal'], series[-1]['ideal']), (3, 0))
+        self.assertEqual((series[0]['idealHours'], series[-1]['idealHours']), (7.0, 0))
+
+    def test_issue_edits_record_transitions(self):
+        issue = self.create_issue(sprint=self.sprint, estimated_hours=5)
+
+        self.client.patch(f'/api/issues/{issue.uid}/', {'status': 'done'}, format='json')
+        self.client.patch(f'/api/issues/{issue.uid}/', {'title': 'Renamed'}, format='json')
+        self.client.patch(f'/api/issues/{issue.uid}/', {'sprintId': None}, format='json')
+
+        self.assertEqual(
+            list(IssueTransition.objects.filter(issue=issue).order_by('id').values_list('changes', 'status', 'sprint_id')),
+            [
+                (IssueTransition.CHANGE_BASELINE, 'todo', self.sprint.pk),
+                (IssueTransition.CHANGE_STATUS, 'done', self.sprint.pk),
+                (IssueTransition.CHANGE_SPRINT, 'done', None),
+            ],
+        )
+
+    def test_unknown_sprint_is_empty(self):
+        response = self.client.get('/api/reports/burndown/', {'sprint_id': 's-missing'})
+
+        self.assertEqual(response.data, [])
+
+
+class CumulativeFlowTests(HubTestCase):
+    now = datetime(2026, 3, 1, 15, 30, tzinfo=dt_timezone.utc)
+
+    def random_history(self, seed):
+        rng = random.Random(seed)
+        issue_rows = []
+        transition_rows = []
+        for pk in rng.sample(range(1, 1000), 60):
+            created = self.now - timedelta(days=rng.uniform(1, 60))
+            moments = sorted(rng.uniform(created.timestamp(), self.now.timestamp()) for _ in range(rng.randint(0, 6)))
+            statuses = [rng.choice(flow.STATUSES) for _ in moments]
+            current = statuses[-1] if statuses else rng.choice(flow.STATUSES)
+            updated = datetime.fromtimestamp(moments[-1], dt_timezone.utc) if moments else self.now - timedelta(hours=1)
+            issue_rows.append((pk, created, updated, current))
+            transition_rows += [
+                (pk, datetime.fromtimestamp(moment, dt_timezone.utc), status)
+                for moment, status in zip(moments, statuses)
+            ]
+        return issue_rows, transition_rows
+
+    def naive_flow(self, issue_rows, transition_rows, days):
+        events = defaultdict(list)
+        for pk, at, status in transition_rows:
+            events[pk].append((at, status))
+        for pk, created, updated, current in issue_rows:
+            if pk not in events:
+                events[pk].append((created, 'todo' if current == 'done' else current))
+                if current == 'done':
+                    events[pk].append((updated, 'done'))
+        today = timezone.localtime(self.now).date()
+        series = []
+        for offset in range(days - 1, -1, -1):
+            day = today - timedelta(days=offset)
+            counts = dict.fromkeys(flow.STATUSES, 0)
+            for history in events.values():
+                seen = [status for at, status in sorted(history) if timezone.localtime(at).date() <= day]
+                if seen:
+                    counts[seen[-1]] += 1
+            series.append({'date': day.isoformat(), **counts})
+        return series
+
+    def test_matches_naive_daily_count(self):
+        for seed, zone, days in ((1, 'UTC', 30), (2, 'America/New_York', 30), (3, 'Asia/Kolkata', 90), (4, 'UTC', 1)):
+            with self.subTest(seed=seed, zone=zone, days=days), self.settings(TIME_ZONE=zone):
+                issue_rows, transition_rows = self.random_history(seed)
+                history = flow.build_history(issue_rows, sorted(transition_rows))
+
+                self.assertEqual(
+                    flow.cumulative_flow(history, days, now=self.now),
+                    self.naive_flow(issue_rows, transition_rows, days),
+                )
+
+    def test_report_ends_at_current_status_counts(self):
+        for status in ('todo', 'todo', 'in_progress', 'done'):
+            self.create_issue(status=status)
+        issue = self.create_issue()
+        self.client.patch(f'/api/issues/{issue.uid}/', {'status': 'in_review'}, format='json')
+
+        response = self.client.get('/api/reports/cumulative-flow/', {'project_id': self.project.uid, 'days': 7})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data), 7)
+        self.assertEqual(
+            response.data[-1],
+            {'date': timezone.localdate().isoformat(), 'todo': 2, 'in_progress': 1, 'in_review': 1, 'done': 1},
+        )
+
+
+class SearchTests(HubTestCase):
+    def search(self, text, **params):
+        response = self.client.get('/api/search/', {'q': text, **params})
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def keys(self, text, **params):
+        return [result['issue']['key'] for result in self.search(text, **params)['results']]
+
+    def test_title_match_outranks_description_match(self):
+        described = self.create_issue(title='Cleanup', description='Rotate the deployment credentials')
+        titled = self.create_issue(title='Deployment pipeline')
+
+        self.assertEqual(self.keys('deployment'), [titled.key, described.key])
+
+    def test_prefix_and_comment_matches(self):
+        issue = self.create_issue(title='Checkout')
+        IssueComment.objects.create(issue=issue, author=self.user, content='Reproduced on the staging cluster')
+
+        results = self.search('stag')['results']
+
+        self.assertEqual([(result['issue']['key'], result['matchedIn']) for result in results], [(issue.key, 'comment')])
+        self.assertIn('<mark>staging</mark>', results[0]['snippet'])
+
+    def test_index_follows_edits_and_deletes(self):
+        issue = self.create_issue(title='Flaky login test')
+
+        self.client.patch(f'/api/issues/{issue.uid}/', {'title': 'Flaky signup test'}, format='json')
+        self.assertEqual(self.keys('login'), [])
+        self.assertEqual(self.keys('signup'), [issue.key])
+
+        self.client.delete(f'/api/issues/{issue.uid}/')
+        self.assertEqual(self.keys('signup'), [])
+
+    def test_bulk_created_issues_are_indexed(self):
+        self.client.post('/api/issues/bulk/', {'operations': [
+            {'op': 'create', 'data': {'projectId': self.project.uid, 'title': 'Quarterly invoice export', 'type': 'task'}},
+        ]}, format='json')
+
+        self.assertEqual(len(self.keys('invoice')), 1)
+
+    def test_scoped_to_project(self):
+        other = Project.objects.create(name='Borealis', key='BOR', lead=self.user)
+        Issue.objects.create(project=other, key='BOR-1', title='Memory leak', issue_type='bug', reporter=self.user)
+        issue = self.create_issue(title='Memory leak')
+
+        self.assertEqual(len(self.keys('memory')), 2)
+        self.assertEqual(self.keys('memory', project_id=self.project.uid), [issue.key])
+
+    def test_rebuild_matches_incremental_index(self):
+        self.create_issue(title='Cache warmup', description='warm the report cache')
+        self.create_issue(title='Report export')
+        incremental = self.keys('report')
+
+        search.rebuild()
+
+        self.assertEqual(self.keys('report'), incremental)
+
+
+class SideEffectTests(HubTestCase):
+    def test_inline_delivery_stores_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            side_effects.notify([Notification(user=self.user, title='Assigned', message='ATL-1')])
+
+        self.assertEqual(Notification.objects.filter(user=self.user).count(), 1)
+        self.assertTrue(side_effects.flush(timeout=0))
+
+
+@override_settings(CACHES=TEST_CACHES, SIDE_EFFECT_QUEUE_SIZE=100)
+class SideEffectWorkerTests(TransactionTestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user('alex', 'alex@example.com', 'pw')
+        self.layer = get_channel_layer()
+        self.addCleanup(side_effects.flush, 5)
+
+    def notify(self):
+        side_effects.notify([Notification(user=self.user, title='Assigned', message='ATL-1')])
+
+    def test_notify_returns_before_delivery(self):
+        release = threading.Event()
+        sent = []
+
+        def slow_send(messages):
+            release.wait(5)
+            sent.extend(messages)
+
+        with mock.patch('hub.side_effects.fanout.send', side_effect=slow_send):
+            self.notify()
+            self.assertFalse(side_effects.flush(timeout=0))
+            release.set()
+            self.assertTrue(side_effects.flush(timeout=5))
+
+        self.assertEqual(Notification.objects.filter(user=self.user).count(), 1)
+        self.assertEqual([(group, message['event']) for group, message in sent], [(fanout.user_group(self.user.id), 'created')])
+
+    def test_worker_batches_queued_items(self):
+        release = threading.Event()
+        batches = []
+        deliver = side_effects._deliver
+
+        def record(batch):
+            release.wait(5)
+            batches.append(len(batch))
+            deliver(batch)
+
+        with mock.patch('hub.side_effects._deliver', side_effect=record):
+            for _ in range(5):
+                self.notify()
+            release.set()
+            self.assertTrue(side_effects.flush(timeout=5))
+
+        self.assertEqual(sum(batches), 5)
+        self.assertLess(len(batches), 5)
+        self.assertEqual(Notification.objects.filter(user=self.user).count(), 5)
+
+    def test_push_without_a_consumer_loop(self):
+        async def join():
+            channel = await self.layer.new_channel()
+            await self.layer.group_add(fanout.user_group(self.user.id), channel)
+            return channel
+
+        channel = async_to_sync(join)()
+        self.notify()
+        self.assertTrue(side_effects.flush(timeout=5))
+
+        message = async_to_sync(asyncio.wait_for)(self.layer.receive(channel), 5)
+        self.assertEqual((message['event'], message['unreadCount']), ('created', 1))
+
+    def test_push_runs_on_the_consumer_loop(self):
+        loop = asyncio.new_event_loop()
+        server = threading.Thread(target=loop.run_forever, daemon=True)
+        server.start()
+        self.addCleanup(loop.close)
+        self.addCleanup(server.join)
+        self.addCleanup(loop.call_soon_threadsafe, loop.stop)
+        self.addCleanup(fanout.bind_loop, None)
+
+        async def connect():
+            fanout.bind_loop(asyncio.get_running_loop())
+            channel = await self.layer.new_channel()
+            await self.layer.group_add(fanout.user_group(self.user.id), channel)
+            return channel
+
+        channel = asyncio.run_coroutine_threadsafe(connect(), loop).result(5)
+        self.notify()
+        self.assertTrue(side_effects.flush(timeout=5))
+
+        receiving = asyncio.wait_for(self.layer.receive(channel), 5)
+        message = asyncio.run_coroutine_threadsafe(receiving, loop).result(5)
+        self.assertEqual((message['event'], message['unreadCount']), ('created', 1))
+
+
+class UnreadCounterTests(HubTestCase):
+    def deliver(self, count, user=None):
+        with self.captureOnCommitCallbacks(execute=True):
+            side_effects.notify([
+                Notification(user=user or self.user, title=f'Assigned {n}', message='ATL-1') for n in range(count)
+            ])
+        return list(Notification.objects.filter(user=user or self.user).order_by('id'))
+
+    def unread_count(self):
+        return self.client.get('/api/notifications/unread-count/').data['unreadCount']
+
+    def stored_counter(self):
+        return NotificationCounter.objects.get(user=self.user).unread
+
+    def test_delivery_increments_the_counter(self):
+        self.deliver(3)
+
+        self.assertEqual(self.stored_counter(), 3)
+        self.assertEqual(self.unread_count(), 3)
+
+    def test_mark_read_is_idempotent(self):
+        first, _ = self.deliver(2)
+        url = f'/api/notifications/{first.uid}/read/'
+
+        with self.captureOnCommitCallbacks(execute=True):
+            counts = [self.client.post(url).data['unreadCount'] for _ in range(3)]
+
+        self.assertEqual(counts, [1, 1, 1])
+        self.assertEqual(self.stored_counter(), 1)
+
+    def test_read_all_is_idempotent(self):
+        self.deliver(4)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            counts = [self.client.post('/api/notifications/read-all/').data['unreadCount'] for _ in range(2)]
+
+        self.assertEqual(counts, [0, 0])
+        self.assertEqual(self.stored_counter(), 0)
+
+    def test_other_users_notification_is_not_found(self):
+        other = get_user_model().objects.create_user('sam', 'sam@example.com', 'pw')
+        notification, = self.deliver(1, user=other)
+        self.deliver(1)
+
+        response = self.client.post(f'/api/notifications/{notification.uid}/read/')
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual((self.unread_count(), NotificationCounter.objects.get(user=other).unread), (1, 1))
+
+    def test_missing_counter_is_seeded_from_rows(self):
+        for is_read in (False, False, True):
+            Notification.objects.create(user=self.user, title='Legacy', message='', is_read=is_read)
+
+        self.assertFalse(NotificationCounter.objects.exists())
+        self.assertEqual(self.unread_count(), 2)
+        self.deliver(1)
+        self.assertEqual(self.unread_count(), 3)
+
+    def test_reconcile_repairs_drift(self):
+        self.deliver(3)
+        NotificationCounter.objects.filter(user=self.user).update(unread=10)
+
+        call_command('reconcile_unread_counters', stdout=mock.Mock())
+
+        self.assertEqual(self.unread_count(), 3)
+
+
+class CoalesceTests(HubTestCase):
+    def deliver(self, *notifications):
+        with self.captureOnCommitCallbacks(execute=True):
+            side_effects.notify(notifications)
+        return list(Notification.objects.filter(user=self.user).order_by('id'))
+
+    def about(self, issue_uid, message='Moved', event='status'):
+        return Notification(
+            user=self.user,
+            title=f'Updated {issue_uid}',
+            message=message,
+            metadata={'issueId': issue_uid, 'event': event},
+        )
+
+    def test_repeats_within_the_window_merge_into_one_row(self):
+        self.deliver(self.about('i-1', 'To review'))
+        row, = self.deliver(self.about('i-1', 'To done'))
+
+        self.assertEqual((row.occurrences, row.message), (2, 'To done'))
+        self.assertEqual(unread.count(self.user.id), 1)
+
+    def test_repeats_within_one_batch_merge(self):
+        row, = self.deliver(self.about('i-1', 'First'), self.about('i-1', 'Second'), self.about('i-1', 'Third'))
+
+        self.assertEqual((row.occurrences, row.message), (3, 'Third'))
+        self.assertEqual(unread.count(self.user.id), 1)
+
+    def test_distinct_targets_and_events_stay_separate(self):
+        rows = self.deliver(self.about('i-1'), self.about('i-2'), self.about('i-1', event='mention'))
+
+        self.assertEqual([row.occurrences for row in rows], [1, 1, 1])
+
+    def test_untargeted_notifications_never_merge(self):
+        rows = self.deliver(*(Notification(user=self.user, title='Digest', message='') for _ in range(2)))
+
+        self.assertEqual(len(rows), 2)
+
+    def test_read_or_expired_rows_start_a_new_one(self):
+        first, = self.deliver(self.about('i-1'))
+        Notification.objects.filter(pk=first.pk).update(is_read=True)
+        second = self.deliver(self.about('i-1'))[-1]
+        window = settings.NOTIFICATION_COALESCE_WINDOW_SECONDS
+        Notification.objects.filter(pk=second.pk).update(created_at=timezone.now() - timedelta(seconds=window + 1))
+
+        rows = self.deliver(self.about('i-1'))
+
+        self.assertEqual([row.occurrences for row in rows], [1, 1, 1])
+
+    @override_settings(NOTIFICATION_COALESCE_WINDOW_SECONDS=0)
+    def test_zero_window_disables_coalescing(self):
+        rows = self.deliver(self.about('i-1'), self.about('i-1'))
+
+        self.assertEqual(len(rows), 2)
+
+    def test_push_carries_the_merged_row(self):
+        self.deliver(self.about('i-1'))
+        with mock.patch('hub.side_effects.fanout.send') as send:
+            self.deliver(self.about('i-1', 'Again'))
+
+        (messages,), _ = send.call_args
+        (group, event), = messages
+        self.assertEqual((group, event['unreadCount']), (fanout.user_group(self.user.id), 1))
+        self.assertEqual([(row['message'], row['count']) for row in event['notifications']], [('Again', 2)])
+
+
+class CompactNotificationsTests(HubTestCase):
+    def setUp(self):
+        super().setUp()
+        old = timezone.now() - timedelta(days=365)
+        for pk in (3, 40, 41, 900000, 900001):
+            Notification.objects.create(id=pk, user=self.user, title='Old', message='', is_read=True)
+        Notification.objects.update(created_at=old)
+        Notification.objects.create(user=self.user, title='New', message='', is_read=True)
+        self.archive = Path(tempfile.mkdtemp()) / 'archive.ndjson'
+
+    def compact(self):
+        call_command('compact_notifications', batch_size=2, sleep=0, archive=str(self.archive), stdout=mock.Mock())
+
+    def archived_ids(self):
+        return [json.loads(line)['id'] for line in self.archive.read_text().splitlines()]
+
+    def test_sparse_ids_take_one_query_per_batch(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.compact()
+
+        selects = [query for query in queries if query['sql'].startswith('SELECT')]
+        self.assertEqual(len(selects), 4)
+        self.assertEqual(len(self.archived_ids()), 5)
+        self.assertEqual(list(Notification.objects.values_list('title', flat=True)), ['New'])
+
+    def test_failed_batch_is_not_archived_twice(self):
+        with mock.patch('hub.management.commands.compact_notifications.os.fsync', side_effect=[None, OSError('disk full')]):
+            with self.assertRaises(OSError):
+                self.compact()
+        self.assertEqual(len(self.archived_ids()), 2)
+        self.compact()
+
+        ids = self.archived_ids()
+        self.assertEqual(len(ids), 5)
+        self.assertEqual(len(set(ids)), 5)
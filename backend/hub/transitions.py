@@ -0,0 +1,138 @@
+from datetime import timedelta
+
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import Issue, IssueTransition
+
+TRACKED_FIELDS = {
+    'status': IssueTransition.CHANGE_STATUS,
+    'sprint_id': IssueTransition.CHANGE_SPRINT,
+    'estimated_hours': IssueTransition.CHANGE_ESTIMATE,
+}
+DONE_STATUS = 'done'
+
+
+def snapshot(issue: Issue):
+    return {field: getattr(issue, field) for field in TRACKED_FIELDS}
+
+
+def _transition(issue: Issue, changes, actor=None, state=None, created_at=None):
+    state = state or snapshot(issue)
+    return IssueTransition(
+        issue_id=issue.pk,
+        project_id=issue.project_id,
+        actor=actor if actor and actor.is_authenticated else None,
+        changes=','.join(changes),
+        status=state['status'],
+        sprint_id=state['sprint_id'],
+        estimated_hours=state['estimated_hours'],
+        created_at=created_at or timezone.now(),
+    )
+
+
+def transition_for(issue: Issue, before, actor=None):
+    if before is None:
+        return _transition(issue, [IssueTransition.CHANGE_CREATED], actor)
+    changes = [change for field, change in TRACKED_FIELDS.items() if before[field] != getattr(issue, field)]
+    return _transition(issue, changes, actor) if changes else None
+
+
+def _baselines(pairs):
+    untracked = {issue.pk: (issue, before) for issue, before in pairs if before is not None}
+    if not untracked:
+        return []
+    tracked = set(IssueTransition.objects.filter(issue_id__in=list(untracked)).values_list('issue_id', flat=True).distinct())
+    return [
+        _transition(issue, [IssueTransition.CHANGE_BASELINE], state=before, created_at=issue.created_at)
+        for pk, (issue, before) in untracked.items()
+        if pk not in tracked
+    ]
+
+
+def record_many(pairs, actor=None):
+    pairs = [(issue, before, transition_for(issue, before, actor)) for issue, before in pairs]
+    pairs = [(issue, before, transition) for issue, before, transition in pairs if transition]
+    if not pairs:
+        return
+    rows = _baselines([(issue, before) for issue, before, _ in pairs])
+    rows += [transition for _, _, transition in pairs]
+    IssueTransition.objects.bulk_create(rows, batch_size=500)
+
+
+def record(issue: Issue, before, actor=None):
+    record_many([(issue, before)], actor)
+
+
+def record_sprint_start(sprint, actor=None):
+    issues = Issue.objects.filter(sprint=sprint).only('id', 'project_id', 'status', 'sprint_id', 'estimated_hours')
+    IssueTransition.objects.bulk_create(
+        [_transition(issue, [IssueTransition.CHANGE_SPRINT_START], actor) for issue in issues],
+        batch_size=500,
+    )
+
+
+def _sprint_events(sprint):
+    in_scope = Q(issue__sprint=sprint) | Q(issue__in=IssueTransition.objects.filter(sprint=sprint).values('issue_id'))
+    events = list(
+        IssueTransition.objects.filter(in_scope)
+        .order_by('created_at', 'id')
+        .values_list('issue_id', 'created_at', 'status', 'sprint_id', 'estimated_hours')
+    )
+    legacy = Issue.objects.filter(sprint=sprint, transitions__isnull=True).values_list(
+        'id', 'created_at', 'updated_at', 'status', 'estimated_hours'
+    )
+    legacy_events = []
+    for issue_id, created_at, updated_at, status, estimate in legacy:
+        done = status == DONE_STATUS
+        legacy_events.append((issue_id, created_at, 'todo' if done else status, sprint.id, estimate))
+        if done:
+            legacy_events.append((issue_id, updated_at, DONE_STATUS, sprint.id, estimate))
+    if legacy_events:
+        events = sorted(events + legacy_events, key=lambda event: event[1])
+    return events
+
+
+def _ideal(total, days, idx):
+    return max(round(total - ((total / days) * idx), 1), 0)
+
+
+def burndown(sprint):
+    start = sprint.start_date
+    days = (sprint.end_date - start).days or 1
+    events = _sprint_events(sprint)
+
+    contributions = {}
+    remaining = 0
+    remaining_hours = 0.0
+    position = 0
+    series = []
+    for idx in range(days + 1):
+        day = start + timedelta(days=idx)
+        while position < len(events) and timezone.localtime(events[position][1]).date() <= day:
+            issue_id, _, status, sprint_id, estimate = events[position]
+            position += 1
+            count, hours = contributions.get(issue_id, (0, 0.0))
+            remaining -= count
+            remaining_hours -= hours
+            if sprint_id == sprint.id and status != DONE_STATUS:
+                count, hours = 1, estimate or 0.0
+            else:
+                count, hours = 0, 0.0
+            contributions[issue_id] = (count, hours)
+            remaining += count
+            remaining_hours += hours
+        series.append((day, remaining, round(remaining_hours, 2)))
+
+    total = series[0][1] or max(point[1] for point in series)
+    total_hours = series[0][2] or max(point[2] for point in series)
+    return [
+        {
+            'date': day.isoformat(),
+            'remaining': count,
+            'ideal': _ideal(total, days, idx),
+            'remainingHours': hours,
+            'idealHours': _ideal(total_hours, days, idx),
+        }
+        for idx, (day, count, hours) in enumerate(series)
+    ]
@@ -0,0 +1,59 @@
+from django.db.models import CharField, Value
+
+from .models import Epic, Issue, Label, Project, Sprint, UserProfile
+
+UID_MODELS = {
+    'user': (UserProfile, 'user_id'),
+    'project': (Project, 'id'),
+    'sprint': (Sprint, 'id'),
+    'epic': (Epic, 'id'),
+    'issue': (Issue, 'id'),
+    'label': (Label, 'id'),
+}
+
+
+def _lookup(uids_by_kind: dict):
+    queries = []
+    for kind, uids in uids_by_kind.items():
+        model, pk_field = UID_MODELS[kind]
+        queries.append(
+            model.objects.filter(uid__in=uids)
+            .order_by()
+            .annotate(kind=Value(kind, output_field=CharField()))
+            .values_list('kind', 'uid', pk_field)
+        )
+    if not queries:
+        return []
+    return queries[0].union(*queries[1:], all=True) if len(queries) > 1 else queries[0]
+
+
+class UidResolver:
+    def __init__(self):
+        self._resolved = {kind: {} for kind in UID_MODELS}
+        self._missing = {kind: set() for kind in UID_MODELS}
+
+    def prime(self, uids_by_kind: dict):
+        pending = {}
+        for kind, uids in uids_by_kind.items():
+            wanted = {uid for uid in uids if uid} - self._resolved[kind].keys() - self._missing[kind]
+            if wanted:
+                pending[kind] = wanted
+        for kind, uid, pk in _lookup(pending):
+            self._resolved[kind][uid] = pk
+        for kind, uids in pending.items():
+            self._missing[kind].update(uids - self._resolved[kind].keys())
+
+    def resolve(self, kind: str, uids) -> dict:
+        wanted = {uid for uid in uids if uid}
+        self.prime({kind: wanted})
+        resolved = self._resolved[kind]
+        return {uid: resolved[uid] for uid in wanted if uid in resolved}
+
+    def pk(self, kind: str, uid):
+        if not uid:
+            return None
+        return self.resolve(kind, [uid]).get(uid)
+
+    def pks(self, kind: str, uids) -> list:
+        mapping = self.resolve(kind, uids)
+        return [mapping[uid] for uid in dict.fromkeys(uids) if uid in mapping]
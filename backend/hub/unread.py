@@ -0,0 +1,70 @@
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Count, F
+from django.db.models.functions import Greatest
+
+from .models import Notification, NotificationCounter
+
+
+def _actual(user_ids):
+    rows = Notification.objects.filter(user_id__in=list(user_ids), is_read=False).order_by().values_list('user_id')
+    return dict(rows.annotate(total=Count('id')))
+
+
+def _seed(user_ids):
+    user_ids = set(user_ids)
+    missing = user_ids - set(NotificationCounter.objects.filter(user_id__in=list(user_ids)).values_list('user_id', flat=True))
+    if missing:
+        actual = _actual(missing)
+        NotificationCounter.objects.bulk_create(
+            [NotificationCounter(user_id=user_id, unread=actual.get(user_id, 0)) for user_id in missing],
+            ignore_conflicts=True,
+        )
+    return missing
+
+
+def adjust(deltas):
+    deltas = {user_id: delta for user_id, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    with transaction.atomic():
+        seeded = _seed(deltas)
+        users_by_delta = defaultdict(list)
+        for user_id, delta in deltas.items():
+            if user_id not in seeded:
+                users_by_delta[delta].append(user_id)
+        for delta, user_ids in users_by_delta.items():
+            NotificationCounter.objects.filter(user_id__in=user_ids).update(unread=Greatest(F('unread') + delta, 0))
+
+
+def counts(user_ids):
+    user_ids = list(dict.fromkeys(user_ids))
+    found = dict(NotificationCounter.objects.filter(user_id__in=user_ids).values_list('user_id', 'unread'))
+    missing = [user_id for user_id in user_ids if user_id not in found]
+    if missing:
+        _seed(missing)
+        found.update(NotificationCounter.objects.filter(user_id__in=missing).values_list('user_id', 'unread'))
+    return found
+
+
+def count(user_id) -> int:
+    return counts([user_id]).get(user_id, 0)
+
+
+def reconcile(batch_size: int = 1000):
+    fixed = 0
+    user_ids = list(NotificationCounter.objects.order_by('user_id').values_list('user_id', flat=True))
+    for start in range(0, len(user_ids), batch_size):
+        chunk = user_ids[start:start + batch_size]
+        with transaction.atomic():
+            actual = _actual(chunk)
+            stored = dict(NotificationCounter.objects.select_for_update().filter(user_id__in=chunk).values_list('user_id', 'unread'))
+            stale = [
+                NotificationCounter(user_id=user_id, unread=actual.get(user_id, 0))
+                for user_id, unread in stored.items()
+                if unread != actual.get(user_id, 0)
+            ]
+            NotificationCounter.objects.bulk_update(stale, ['unread'])
+            fixed += len(stale)
+    return len(user_ids), fixed
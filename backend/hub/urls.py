@@ -4,6 +4,7 @@ from .views import (
     AuthLoginView,
     AuthLogoutView,
     AuthMeView,
+    BoardView,
     BurndownReportView,
     ChatChannelCreateView,
     ChatChannelDetailView,
@@ -14,6 +15,8 @@ from .views import (
     ChatRoomListView,
     ChatRoomMessagesView,
     ChatRoomReadView,
+    CumulativeFlowReportView,
+    CycleTimeReportView,
     DashboardReportView,
     EpicDetailView,
     EpicsView,
@@ -21,14 +24,18 @@ from .views import (
     IssueCommentDetailView,
     IssueAttachmentDeleteView,
     IssueAttachmentUploadView,
+    IssueBulkView,
     IssueDetailView,
     IssueLinkCreateView,
     IssueLinkDeleteView,
     IssueLogTimeView,
     IssueMoveView,
+    IssueRenderCacheStatsView,
     IssuesView,
+    IssueTableView,
     IssueWatchToggleView,
     LabelsView,
+    LeadTimeReportView,
     NotificationListView,
     NotificationMarkReadView,
     NotificationReadAllView,
@@ -38,10 +45,13 @@ from .views import (
     ProjectDetailView,
     ProjectListView,
     ProjectOnboardingView,
+    SearchView,
     SprintCompleteView,
     SprintDetailView,
     SprintStartView,
     SprintsView,
+    SyncView,
+    ThroughputReportView,
     UsersListView,
     UserDetailView,
     VelocityReportView,
@@ -87,7 +97,10 @@ urlpatterns = [
     path('sprints/<str:sprint_uid>/start/', SprintStartView.as_view()),
     path('sprints/<str:sprint_uid>/complete/', SprintCompleteView.as_view()),
 
+    path('boards/', BoardView.as_view()),
     path('issues/', IssuesView.as_view()),
+    path('issues/bulk/', IssueBulkView.as_view()),
+    path('issues/table/', IssueTableView.as_view()),
     path('issues/<str:issue_uid>/', IssueDetailView.as_view()),
     path('issues/<str:issue_uid>/move/', IssueMoveView.as_view()),
     path('issues/<str:issue_uid>/comments/', IssueCommentCreateView.as_view()),
@@ -99,7 +112,15 @@ urlpatterns = [
     path('issues/<str:issue_uid>/attachments/', IssueAttachmentUploadView.as_view()),
     path('issues/<str:issue_uid>/attachments/<str:attachment_uid>/', IssueAttachmentDeleteView.as_view()),
 
+    path('search/', SearchView.as_view()),
+    path('sync/', SyncView.as_view()),
+
     path('reports/dashboard/', DashboardReportView.as_view()),
     path('reports/burndown/', BurndownReportView.as_view()),
     path('reports/velocity/', VelocityReportView.as_view()),
+    path('reports/cycle-time/', CycleTimeReportView.as_view()),
+    path('reports/lead-time/', LeadTimeReportView.as_view()),
+    path('reports/throughput/', ThroughputReportView.as_view()),
+    path('reports/cumulative-flow/', CumulativeFlowReportView.as_view()),
+    path('reports/issue-cache/', IssueRenderCacheStatsView.as_view()),
 ]
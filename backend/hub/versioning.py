@@ -0,0 +1,85 @@
+import hashlib
+from collections import defaultdict
+from functools import wraps
+
+from django.db import transaction
+from django.db.models import F
+from django.utils.http import parse_etags
+from rest_framework import status
+from rest_framework.response import Response
+
+from .models import ProjectChange, ProjectVersion
+
+
+def record_changes(project_id, entity: str, uids, deleted: bool = False):
+    uids = [uid for uid in uids if uid]
+    if not project_id or not uids:
+        return None
+    with transaction.atomic(savepoint=False):
+        if not ProjectVersion.objects.filter(project_id=project_id).update(version=F('version') + 1):
+            return None
+        version = ProjectVersion.objects.filter(project_id=project_id).values_list('version', flat=True).get()
+        ProjectChange.objects.bulk_create([
+            ProjectChange(project_id=project_id, version=version, entity=entity, uid=uid, deleted=deleted)
+            for uid in uids
+        ])
+    return version
+
+
+def record_issue_changes(issues):
+    uids_by_project = defaultdict(list)
+    for project_id, uid in issues.values_list('project_id', 'uid'):
+        uids_by_project[project_id].append(uid)
+    for project_id, uids in uids_by_project.items():
+        record_changes(project_id, ProjectChange.ENTITY_ISSUE, uids)
+
+
+def current_version(project_id):
+    return ProjectVersion.objects.filter(project_id=project_id).values_list('version', flat=True).first() or 0
+
+
+def project_version(project_uid: str):
+    versions = list(ProjectVersion.objects.filter(project__uid=project_uid).values_list('version', flat=True)[:1])
+    return versions[0] if versions else None
+
+
+def project_etag(request):
+    project_uid = request.query_params.get('project_id')
+    if not project_uid:
+        return None
+    version = project_version(project_uid)
+    if version is None:
+        return None
+    return representation_etag(request, version)
+
+
+def representation_etag(request, version):
+    variant = f"{request.build_absolute_uri()}|{request.META.get('HTTP_ACCEPT', '')}"
+    return f'"{version}-{hashlib.sha1(variant.encode()).hexdigest()[:16]}"'
+
+
+def not_modified(request, etag):
+    if_none_match = parse_etags(request.META.get('HTTP_IF_NONE_MATCH', ''))
+    if etag in if_none_match or '*' in if_none_match:
+        return Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag, 'Cache-Control': 'private, no-cache'})
+    return None
+
+
+def with_etag(response, etag):
+    if etag and response.status_code == status.HTTP_200_OK:
+        response['ETag'] = etag
+        response['Cache-Control'] = 'private, no-cache'
+    return response
+
+
+def conditional_on_project_version(view_method):
+    @wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        etag = project_etag(request)
+        if etag:
+            cached = not_modified(request, etag)
+            if cached:
+                return cached
+        return with_etag(view_method(self, request, *args, **kwargs), etag)
+
+    return wrapper
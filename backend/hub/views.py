@@ -1,12 +1,10 @@
-from collections import defaultdict
-from datetime import timedelta
+from collections import Counter, defaultdict
 import re
 
-from asgiref.sync import async_to_sync
-from channels.layers import get_channel_layer
 from django.contrib.auth import authenticate, get_user_model
 from django.db import transaction
-from django.db.models import Q
+from django.db.models import Count, F, Prefetch, Q, Window
+from django.db.models.functions import RowNumber
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.authtoken.models import Token
@@ -28,19 +26,30 @@ from .models import (
     Notification,
     PlatformSetupInstruction,
     Project,
+    ProjectChange,
     ProjectOnboarding,
     Sprint,
 )
+from . import counters, fanout, flow, render_cache, report_cache, rollups, search, side_effects, transitions, unread
+from .columnar import build_columns
+from .keys import allocate_epic_keys, allocate_issue_keys
+from .pagination import InvalidCursor, encode_cursor, keyset_page, parse_page_size
 from .permissions import can_edit_issue, can_manage_project, can_manage_project_onboarding, can_manage_sprints
 from .serializers import (
+    AttachmentSerializer,
+    BOARD_CARD_FIELDS,
     ChatMessageSerializer,
     ChatRoomSerializer,
+    CommentSerializer,
     EpicSerializer,
     EpicWriteSerializer,
     ForgotPasswordSerializer,
+    ISSUE_EXPANDABLE_FIELDS,
+    ISSUE_SUMMARY_FIELDS,
     IssueSerializer,
     IssueWriteSerializer,
     LabelSerializer,
+    LinkSerializer,
     LoginSerializer,
     PlatformSetupInstructionSerializer,
     PlatformSetupInstructionWriteSerializer,
@@ -54,9 +63,70 @@ from .serializers import (
     UserSerializer,
     UserWriteSerializer,
 )
+from .uids import UidResolver
+from .streaming import StreamingRendererMixin, stream_format, stream_response
+from .versioning import (
+    conditional_on_project_version,
+    current_version,
+    not_modified,
+    record_changes,
+    record_issue_changes,
+    representation_etag,
+    with_etag,
+)
+
 
 User = get_user_model()
 MENTION_PATTERN = re.compile(r'(?<!\w)@([A-Za-z0-9._-]{2,64})')
+ISSUE_SELECT_PLAN = {
+    'assigneeId': 'assignee__profile',
+    'reporterId': 'reporter__profile',
+    'sprintId': 'sprint',
+    'epicId': 'epic',
+    'parentId': 'parent',
+}
+BULK_ISSUE_OPS = ('create', 'update', 'move', 'delete')
+MAX_BULK_ISSUE_OPERATIONS = 5000
+BOARD_COLUMN_SIZE = 20
+ISSUE_TABLE_COLUMNS = {
+    'id': 'uid',
+    'key': 'key',
+    'type': 'issue_type',
+    'status': 'status',
+    'priority': 'priority',
+    'assigneeId': 'assignee__profile__uid',
+    'sprintId': 'sprint__uid',
+    'epicId': 'epic__uid',
+    'estimatedHours': 'estimated_hours',
+    'loggedHours': 'logged_hours',
+    'createdAt': 'created_at',
+    'updatedAt': 'updated_at',
+}
+ISSUE_TABLE_DICTIONARY_COLUMNS = {'type', 'status', 'priority', 'assigneeId', 'sprintId', 'epicId'}
+ISSUE_TABLE_TIMESTAMP_COLUMNS = {'createdAt', 'updatedAt'}
+BULK_ISSUE_UPDATE_FIELDS = [
+    'title',
+    'description',
+    'issue_type',
+    'status',
+    'priority',
+    'assignee',
+    'reporter',
+    'sprint',
+    'epic',
+    'parent',
+    'due_date',
+    'estimated_hours',
+    'logged_hours',
+    'updated_at',
+]
+ISSUE_PREFETCH_PLAN = {
+    'labels': 'labels',
+    'comments': Prefetch('comments', queryset=IssueComment.objects.select_related('author__profile')),
+    'links': Prefetch('links', queryset=IssueLink.objects.select_related('target_issue')),
+    'watchers': Prefetch('watchers', queryset=User.objects.select_related('profile')),
+    'attachments': Prefetch('attachments', queryset=IssueAttachment.objects.select_related('uploaded_by__profile')),
+}
 
 
 def _user_by_uid(uid: str):
@@ -94,7 +164,7 @@ def _dm_key(user_a_id: int, user_b_id: int):
     return f'global:{low}:{high}'
 
 
-def _create_notifications(users, *, title: str, message: str, notification_type: str, actor=None, action_url: str = '', metadata=None):
+def _notification_rows(users, *, title: str, message: str, notification_type: str, actor=None, action_url: str = '', metadata=None):
     metadata = metadata or {}
     recipients = []
     seen_ids = set()
@@ -108,7 +178,7 @@ def _create_notifications(users, *, title: str, message: str, notification_type:
         seen_ids.add(user.id)
         recipients.append(user)
 
-    Notification.objects.bulk_create([
+    return [
         Notification(
             user=user,
             title=title,
@@ -118,29 +188,26 @@ def _create_notifications(users, *, title: str, message: str, notification_type:
             metadata=metadata,
         )
         for user in recipients
-    ])
-
-    channel_layer = get_channel_layer()
-    if channel_layer:
-        for user in recipients:
-            async_to_sync(channel_layer.group_send)(
-                f'user_notifications_{user.id}',
-                {'type': 'notification_event', 'event': 'created'},
-            )
+    ]
+
+
+def _send_notifications(notifications):
+    side_effects.notify(notifications)
+
+
+def _create_notifications(users, **kwargs):
+    _send_notifications(_notification_rows(users, **kwargs))
 
 
 def _emit_chat_event(room: ChatRoom, event_type: str, payload: dict):
-    channel_layer = get_channel_layer()
-    if not channel_layer:
-        return
-    async_to_sync(channel_layer.group_send)(
-        f'chat_room_{room.uid}',
+    side_effects.send([(
+        fanout.chat_group(room.uid),
         {
             'type': 'chat_event',
             'event_type': event_type,
             'payload': payload,
         },
-    )
+    )])
 
 
 def _is_chat_member(room: ChatRoom, user):
@@ -193,11 +260,118 @@ def _project_participants(project: Project):
     return User.objects.filter(id__in=user_ids)
 
 
-def _issue_response(issue: Issue, request):
-    return IssueSerializer(issue, context={'request': request}).data
+def _csv_param(value):
+    if value is None:
+        return None
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+def _issue_fields(request, default=None):
+    fields = _csv_param(request.query_params.get('fields'))
+    expand = _csv_param(request.query_params.get('expand'))
+    if fields is None and expand is None:
+        return default
+    if fields is None:
+        fields = [f for f in (default or IssueSerializer.Meta.fields) if f not in ISSUE_EXPANDABLE_FIELDS]
+    selected = {'id', *fields, *(expand or [])}
+    return [f for f in IssueSerializer.Meta.fields if f in selected]
+
+
+def _issue_queryset(fields=None):
+    fields = IssueSerializer.Meta.fields if fields is None else fields
+    qs = Issue.objects.all()
+    select = [ISSUE_SELECT_PLAN[f] for f in fields if f in ISSUE_SELECT_PLAN]
+    if select:
+        qs = qs.select_related(*select)
+    prefetch = [ISSUE_PREFETCH_PLAN[f] for f in fields if f in ISSUE_PREFETCH_PLAN]
+    if prefetch:
+        qs = qs.prefetch_related(*prefetch)
+    if 'description' not in fields:
+        qs = qs.defer('description')
+    return qs
+
+
+def _load_full_issues(issue_ids):
+    return _issue_queryset().filter(pk__in=issue_ids)
+
+
+def _render_issues(qs, request):
+    return render_cache.render_issues(qs.values_list(*render_cache.ROW_VERSION_FIELDS), _load_full_issues, request)
 
 
-def _apply_issue_payload(issue: Issue, payload: dict, request_user):
+def _issues_changed(issue_ids):
+    render_cache.invalidate(issue_ids)
+    record_issue_changes(Issue.objects.filter(id__in=issue_ids))
+
+
+def _prefers_minimal(request):
+    preferences = request.headers.get('Prefer', '').replace(';', ',').split(',')
+    return any(preference.strip().lower() == 'return=minimal' for preference in preferences)
+
+
+def _minimal_response(data, status_code=status.HTTP_200_OK):
+    return Response(data, status=status_code, headers={'Preference-Applied': 'return=minimal'})
+
+
+def _issue_fields_response(issue: Issue, fields, request, status_code=status.HTTP_200_OK):
+    data = IssueSerializer(issue, fields=['id', *fields], context={'request': request}).data
+    return _minimal_response(data, status_code)
+
+
+def _issue_response(issue: Issue, request):
+    fields = _issue_fields(request)
+    if fields is None:
+        return _render_issues(Issue.objects.filter(pk=issue.pk), request)[0]
+    issue = _issue_queryset(fields).get(pk=issue.pk)
+    return IssueSerializer(issue, fields=fields, context={'request': request}).data
+
+
+def _filter_issues(qs, params):
+    project_uid = params.get('project_id')
+    if project_uid:
+        qs = qs.filter(project__uid=project_uid)
+
+    search_text = params.get('search')
+    if search_text:
+        qs = qs.filter(search.issue_filter(search_text))
+
+    for param, lookup in [
+        ('sprint_id', 'sprint__uid'),
+        ('epic_id', 'epic__uid'),
+        ('assignee_id', 'assignee__profile__uid'),
+        ('type', 'issue_type'),
+        ('status', 'status'),
+    ]:
+        value = params.get(param)
+        if value:
+            qs = qs.filter(**{lookup: value})
+
+    include_subtasks = params.get('include_subtasks', 'true').lower() == 'true'
+    if not include_subtasks:
+        qs = qs.filter(parent__isnull=True)
+    return qs
+
+
+ISSUE_PAYLOAD_REFERENCES = {
+    'assigneeId': ('assignee_id', 'user'),
+    'reporterId': ('reporter_id', 'user'),
+    'sprintId': ('sprint_id', 'sprint'),
+    'epicId': ('epic_id', 'epic'),
+    'parentId': ('parent_id', 'issue'),
+}
+
+
+def _prime_issue_payloads(resolver: UidResolver, payloads):
+    uids_by_kind = defaultdict(set)
+    for payload in payloads:
+        for key, (_, kind) in ISSUE_PAYLOAD_REFERENCES.items():
+            if payload.get(key):
+                uids_by_kind[kind].add(payload[key])
+        uids_by_kind['label'].update(payload.get('labels') or [])
+    resolver.prime(uids_by_kind)
+
+
+def _set_issue_fields(issue: Issue, payload: dict, request_user, resolver: UidResolver):
     if 'title' in payload:
         issue.title = payload['title']
     if 'description' in payload:
@@ -208,16 +382,11 @@ def _apply_issue_payload(issue: Issue, payload: dict, request_user):
         issue.priority = payload['priority']
     if 'status' in payload:
         issue.status = payload['status']
-    if 'assigneeId' in payload:
-        issue.assignee = _user_by_uid(payload.get('assigneeId'))
-    if 'reporterId' in payload:
-        issue.reporter = _user_by_uid(payload.get('reporterId')) or request_user
-    if 'sprintId' in payload:
-        issue.sprint = _sprint_by_uid(payload.get('sprintId'))
-    if 'epicId' in payload:
-        issue.epic = _epic_by_uid(payload.get('epicId'))
-    if 'parentId' in payload:
-        issue.parent = _issue_by_uid(payload.get('parentId'))
+    for key, (attname, kind) in ISSUE_PAYLOAD_REFERENCES.items():
+        if key in payload:
+            setattr(issue, attname, resolver.pk(kind, payload.get(key)))
+    if 'reporterId' in payload and not issue.reporter_id:
+        issue.reporter_id = request_user.pk
     if 'dueDate' in payload:
         issue.due_date = payload.get('dueDate')
     if 'timeTracking' in payload:
@@ -227,10 +396,18 @@ def _apply_issue_payload(issue: Issue, payload: dict, request_user):
         if 'loggedHours' in tracking:
             issue.logged_hours = tracking.get('loggedHours') or 0
 
+
+def _apply_issue_payload(issue: Issue, payload: dict, request_user, resolver: UidResolver | None = None, created: bool = False):
+    resolver = resolver or UidResolver()
+    _prime_issue_payloads(resolver, [payload])
+    before = None if created else transitions.snapshot(issue)
+    if not created:
+        issue._counter_state = counters.state(issue)
+    _set_issue_fields(issue, payload, request_user, resolver)
     issue.save()
+    transitions.record(issue, before, request_user)
     if 'labels' in payload:
-        labels = Label.objects.filter(uid__in=payload['labels'])
-        issue.labels.set(labels)
+        issue.labels.set(resolver.pks('label', payload['labels']))
 
 
 class AuthLoginView(APIView):
@@ -270,9 +447,12 @@ class AuthLogoutView(APIView):
         return Response({'success': True})
 
 
-class UsersListView(APIView):
+class UsersListView(StreamingRendererMixin, APIView):
     def get(self, request):
         users = User.objects.select_related('profile').order_by('first_name', 'last_name')
+        content_type = stream_format(request)
+        if content_type:
+            return stream_response(request, users, lambda batch: UserSerializer(batch, many=True).data, content_type)
         return Response(UserSerializer(users, many=True).data)
 
     def post(self, request):
@@ -355,7 +535,11 @@ class UserDetailView(APIView):
                 {'detail': 'Cannot delete this user because they are a project lead or issue reporter'},
                 status=status.HTTP_400_BAD_REQUEST,
             )
+        affected_issue_ids = set(
+            Issue.objects.filter(Q(assignee=user) | Q(watchers=user)).values_list('id', flat=True)
+        )
         user.delete()
+        _issues_changed(affected_issue_ids)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
@@ -529,16 +713,21 @@ class PlatformSetupInstructionDetailView(APIView):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
-class LabelsView(APIView):
+class LabelsView(StreamingRendererMixin, APIView):
+    @conditional_on_project_version
     def get(self, request):
         project_uid = request.query_params.get('project_id')
         labels = Label.objects.all()
         if project_uid:
             labels = labels.filter(project__uid=project_uid)
+        content_type = stream_format(request)
+        if content_type:
+            return stream_response(request, labels.order_by('id'), lambda batch: LabelSerializer(batch, many=True).data, content_type)
         return Response(LabelSerializer(labels, many=True).data)
 
 
 class EpicsView(APIView):
+    @conditional_on_project_version
     def get(self, request):
         project_uid = request.query_params.get('project_id')
         epics = Epic.objects.all().order_by('-created_at')
@@ -555,10 +744,9 @@ class EpicsView(APIView):
 
         serializer = EpicWriteSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        count = Epic.objects.filter(project=project).count() + 1
         epic = Epic.objects.create(
             project=project,
-            key=f"{project.key}-E{count}",
+            key=allocate_epic_keys(project)[0],
             name=serializer.validated_data['name'],
             summary=serializer.validated_data.get('summary', ''),
             color=serializer.validated_data.get('color', '#6554C0'),
@@ -588,12 +776,15 @@ class EpicDetailView(APIView):
         epic = _epic_by_uid(epic_uid)
         if not epic:
             return Response(status=status.HTTP_204_NO_CONTENT)
-        Issue.objects.filter(epic=epic).update(epic=None)
+        detached_issue_ids = list(Issue.objects.filter(epic=epic).values_list('id', flat=True))
+        Issue.objects.filter(id__in=detached_issue_ids).update(epic=None)
+        _issues_changed(detached_issue_ids)
         epic.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
 class SprintsView(APIView):
+    @conditional_on_project_version
     def get(self, request):
         project_uid = request.query_params.get('project_id')
         sprints = Sprint.objects.all().order_by('start_date')
@@ -636,12 +827,17 @@ class SprintDetailView(APIView):
         }
         serializer = SprintWriteSerializer(data=data)
         serializer.is_valid(raise_exception=True)
+        was_completed = sprint.status == Sprint.STATUS_COMPLETED
         sprint.name = serializer.validated_data['name']
         sprint.goal = serializer.validated_data.get('goal', '')
         sprint.status = serializer.validated_data.get('status', sprint.status)
         sprint.start_date = serializer.validated_data['startDate']
         sprint.end_date = serializer.validated_data['endDate']
         sprint.save()
+        if sprint.status == Sprint.STATUS_COMPLETED and not was_completed:
+            rollups.freeze([sprint.id])
+        elif was_completed and sprint.status != Sprint.STATUS_COMPLETED:
+            rollups.thaw([sprint.id])
         return Response(SprintSerializer(sprint).data)
 
     def delete(self, request, sprint_uid):
@@ -650,21 +846,30 @@ class SprintDetailView(APIView):
         sprint = _sprint_by_uid(sprint_uid)
         if not sprint:
             return Response(status=status.HTTP_204_NO_CONTENT)
-        Issue.objects.filter(sprint=sprint).update(sprint=None)
+        detached_issue_ids = list(Issue.objects.filter(sprint=sprint).values_list('id', flat=True))
+        Issue.objects.filter(id__in=detached_issue_ids).update(sprint=None)
+        _issues_changed(detached_issue_ids)
         sprint.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
 class SprintStartView(APIView):
+    @transaction.atomic
     def post(self, request, sprint_uid):
         if not can_manage_sprints(request.user):
             return Response({'detail': 'Permission denied'}, status=status.HTTP_403_FORBIDDEN)
         sprint = _sprint_by_uid(sprint_uid)
         if not sprint:
             return Response({'detail': 'Not found'}, status=status.HTTP_404_NOT_FOUND)
-        Sprint.objects.filter(project=sprint.project, status='active').exclude(id=sprint.id).update(status='completed')
+        previous_active = Sprint.objects.filter(project=sprint.project, status='active').exclude(id=sprint.id)
+        previous = list(previous_active.values_list('id', 'uid'))
+        previous_uids = [uid for _, uid in previous]
+        rollups.freeze([pk for pk, _ in previous])
+        previous_active.update(status='completed')
+        record_changes(sprint.project_id, ProjectChange.ENTITY_SPRINT, previous_uids)
         sprint.status = 'active'
         sprint.save(update_fields=['status'])
+        transitions.record_sprint_start(sprint, request.user)
         _create_notifications(
             _project_participants(sprint.project),
             title=f"{sprint.name} started",
@@ -678,15 +883,32 @@ class SprintStartView(APIView):
 
 
 class SprintCompleteView(APIView):
+    @transaction.atomic
     def post(self, request, sprint_uid):
         if not can_manage_sprints(request.user):
             return Response({'detail': 'Permission denied'}, status=status.HTTP_403_FORBIDDEN)
         sprint = _sprint_by_uid(sprint_uid)
         if not sprint:
             return Response({'detail': 'Not found'}, status=status.HTTP_404_NOT_FOUND)
+        if sprint.status == Sprint.STATUS_COMPLETED:
+            return Response({'detail': 'Sprint is already completed'}, status=status.HTTP_400_BAD_REQUEST)
         sprint.status = 'completed'
         sprint.save(update_fields=['status'])
-        Issue.objects.filter(sprint=sprint).exclude(status='done').update(sprint=None)
+        rollups.freeze([sprint.id])
+        moved = list(
+            Issue.objects.filter(sprint=sprint)
+            .exclude(status='done')
+            .only('id', 'project_id', 'status', 'sprint_id', 'assignee_id', 'estimated_hours', 'created_at')
+        )
+        moved_issue_ids = [issue.id for issue in moved]
+        Issue.objects.filter(id__in=moved_issue_ids).update(sprint=None)
+        before = {issue.id: transitions.snapshot(issue) for issue in moved}
+        counted = {issue.id: counters.state(issue) for issue in moved}
+        for issue in moved:
+            issue.sprint_id = None
+        transitions.record_many([(issue, before[issue.id]) for issue in moved], request.user)
+        counters.move([(counted[issue.id], counters.state(issue)) for issue in moved])
+        _issues_changed(moved_issue_ids)
         _create_notifications(
             _project_participants(sprint.project),
             title=f"{sprint.name} completed",
@@ -699,35 +921,47 @@ class SprintCompleteView(APIView):
         return Response(SprintSerializer(sprint).data)
 
 
-class IssuesView(APIView):
+class IssuesView(StreamingRendererMixin, APIView):
+    @conditional_on_project_version
     def get(self, request):
-        qs = Issue.objects.select_related('assignee__profile', 'reporter__profile', 'sprint', 'epic', 'parent').prefetch_related('labels', 'comments__author__profile', 'links__target_issue', 'watchers__profile')
-
-        project_uid = request.query_params.get('project_id')
-        if project_uid:
-            qs = qs.filter(project__uid=project_uid)
-
-        search = request.query_params.get('search')
-        if search:
-            qs = qs.filter(Q(title__icontains=search) | Q(key__icontains=search))
-
-        for param, lookup in [
-            ('sprint_id', 'sprint__uid'),
-            ('epic_id', 'epic__uid'),
-            ('assignee_id', 'assignee__profile__uid'),
-            ('type', 'issue_type'),
-            ('status', 'status'),
-        ]:
-            value = request.query_params.get(param)
-            if value:
-                qs = qs.filter(**{lookup: value})
-
-        include_subtasks = request.query_params.get('include_subtasks', 'true').lower() == 'true'
-        if not include_subtasks:
-            qs = qs.filter(parent__isnull=True)
+        if 'limit' in request.query_params or 'cursor' in request.query_params:
+            return self._get_page(request)
+
+        fields = _issue_fields(request)
+        content_type = stream_format(request)
+        if fields is None:
+            issues = _filter_issues(Issue.objects.all(), request.query_params).order_by('-updated_at')
+            if content_type:
+                rows = issues.values_list(*render_cache.ROW_VERSION_FIELDS)
+                return stream_response(
+                    request,
+                    rows,
+                    lambda batch: render_cache.render_issues(batch, _load_full_issues, request),
+                    content_type,
+                )
+            return Response(_render_issues(issues, request))
+        issues = _filter_issues(_issue_queryset(fields), request.query_params).order_by('-updated_at')
+        if content_type:
+            return stream_response(
+                request,
+                issues,
+                lambda batch: IssueSerializer(batch, many=True, fields=fields, context={'request': request}).data,
+                content_type,
+            )
+        return Response(IssueSerializer(issues, many=True, fields=fields, context={'request': request}).data)
 
-        issues = qs.order_by('-updated_at')
-        return Response(IssueSerializer(issues, many=True, context={'request': request}).data)
+    def _get_page(self, request):
+        fields = _issue_fields(request, default=ISSUE_SUMMARY_FIELDS)
+        qs = _filter_issues(_issue_queryset(fields), request.query_params)
+        limit = parse_page_size(request.query_params.get('limit'))
+        try:
+            issues, next_cursor = keyset_page(qs, request.query_params.get('cursor'), limit)
+        except InvalidCursor:
+            return Response({'detail': 'Invalid cursor'}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({
+            'results': IssueSerializer(issues, many=True, fields=fields, context={'request': request}).data,
+            'next': next_cursor,
+        })
 
     @transaction.atomic
     def post(self, request):
@@ -737,18 +971,19 @@ class IssuesView(APIView):
         if not project:
             return Response({'detail': 'projectId is required'}, status=status.HTTP_400_BAD_REQUEST)
 
-        next_num = Issue.objects.filter(project=project).count() + 101
+        resolver = UidResolver()
+        _prime_issue_payloads(resolver, [serializer.validated_data])
         issue = Issue.objects.create(
             project=project,
-            key=f"{project.key}-{next_num}",
+            key=allocate_issue_keys(project)[0],
             title=serializer.validated_data['title'],
             description=serializer.validated_data.get('description', ''),
             issue_type=serializer.validated_data['type'],
             status=serializer.validated_data.get('status', 'todo'),
             priority=serializer.validated_data.get('priority', 'medium'),
-            reporter=_user_by_uid(serializer.validated_data.get('reporterId')) or request.user,
+            reporter_id=resolver.pk('user', serializer.validated_data.get('reporterId')) or request.user.pk,
         )
-        _apply_issue_payload(issue, serializer.validated_data, request.user)
+        _apply_issue_payload(issue, serializer.validated_data, request.user, resolver, created=True)
         if request.user.is_authenticated:
             issue.watchers.add(request.user)
         _create_notifications(
@@ -760,20 +995,259 @@ class IssuesView(APIView):
             action_url='/backlog',
             metadata={'issueId': issue.uid, 'issueKey': issue.key},
         )
+        if _prefers_minimal(request):
+            return _issue_fields_response(issue, ['key'], request, status.HTTP_201_CREATED)
         return Response(_issue_response(issue, request), status=status.HTTP_201_CREATED)
 
 
+class IssueTableView(APIView):
+    @conditional_on_project_version
+    def get(self, request):
+        names = list(ISSUE_TABLE_COLUMNS)
+        rows = list(
+            _filter_issues(Issue.objects.all(), request.query_params)
+            .order_by('id')
+            .values_list(*ISSUE_TABLE_COLUMNS.values())
+        )
+        return Response({
+            'rows': len(rows),
+            'timestampUnit': 'ms',
+            'columns': build_columns(
+                rows,
+                names,
+                dictionary=ISSUE_TABLE_DICTIONARY_COLUMNS,
+                timestamps=ISSUE_TABLE_TIMESTAMP_COLUMNS,
+            ),
+        })
+
+
+class IssueBulkView(APIView):
+    @transaction.atomic
+    def post(self, request):
+        operations = request.data.get('operations')
+        if not isinstance(operations, list) or not operations:
+            return Response({'detail': 'operations must be a non-empty list'}, status=status.HTTP_400_BAD_REQUEST)
+        if len(operations) > MAX_BULK_ISSUE_OPERATIONS:
+            return Response(
+                {'detail': f'At most {MAX_BULK_ISSUE_OPERATIONS} operations per request'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        parsed, errors = self._parse(operations)
+        if errors:
+            return Response({'errors': errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        payloads = [data for _, _, data in parsed if data]
+        targets = Issue.objects.in_bulk(
+            {uid for op, uid, _ in parsed if op != 'create'},
+            field_name='uid',
+        )
+        projects = Project.objects.in_bulk({data.get('projectId') for op, _, data in parsed if op == 'create'}, field_name='uid')
+        for index, (op, uid, data) in enumerate(parsed):
+            if op == 'create' and data.get('projectId') not in projects:
+                errors.append({'index': index, 'detail': 'projectId is required'})
+            elif op in ('update', 'move') and uid not in targets:
+                errors.append({'index': index, 'detail': 'Not found'})
+        if errors:
+            return Response({'errors': errors}, status=status.HTTP_400_BAD_REQUEST)
+        denied = [
+            {'index': index, 'detail': 'Permission denied'}
+            for index, (op, uid, _) in enumerate(parsed)
+            if uid in targets and not can_edit_issue(request.user, targets[uid])
+        ]
+        if denied:
+            return Response({'errors': denied}, status=status.HTTP_403_FORBIDDEN)
+
+        resolver = UidResolver()
+        _prime_issue_payloads(resolver, payloads)
+        create_counts = Counter(data['projectId'] for op, _, data in parsed if op == 'create')
+        keys = {uid: iter(allocate_issue_keys(projects[uid], count)) for uid, count in create_counts.items()}
+
+        before = {issue.pk: (issue.assignee_id, issue.status) for issue in targets.values()}
+        states = {issue.pk: transitions.snapshot(issue) for issue in targets.values()}
+        counted = {issue.pk: counters.state(issue) for issue in targets.values()}
+        created = []
+        changed = {}
+        deleted = {}
+        label_updates = []
+        results = []
+        now = timezone.now()
+        for op, uid, data in parsed:
+            if op == 'create':
+                project = projects[data['projectId']]
+                issue = Issue(
+                    project=project,
+                    key=next(keys[project.uid]),
+                    title=data['title'],
+                    description=data.get('description', ''),
+                    issue_type=data['type'],
+                    status=data.get('status', 'todo'),
+                    priority=data.get('priority', 'medium'),
+                    reporter_id=resolver.pk('user', data.get('reporterId')) or request.user.pk,
+                )
+                _set_issue_fields(issue, data, request.user, resolver)
+                created.append(issue)
+            elif op == 'delete':
+                issue = targets.get(uid)
+                if issue:
+                    changed.pop(issue.pk, None)
+                    deleted[issue.pk] = issue
+                results.append({'op': op, 'id': uid})
+                continue
+            else:
+                issue = targets[uid]
+                if issue.pk in deleted:
+                    results.append({'op': op, 'id': uid, 'key': issue.key})
+                    continue
+                _set_issue_fields(issue, data, request.user, resolver)
+                issue.updated_at = now
+                changed[issue.pk] = issue
+            if 'labels' in data:
+                label_updates.append((issue, resolver.pks('label', data['labels'])))
+            results.append({'op': op, 'id': issue.uid, 'key': issue.key})
+
+        Issue.objects.bulk_create(created, batch_size=500)
+        Issue.objects.bulk_update(list(changed.values()), BULK_ISSUE_UPDATE_FIELDS, batch_size=500)
+        self._write_relations(request.user, created, label_updates, deleted)
+        if deleted:
+            Issue.objects.filter(pk__in=list(deleted)).delete()
+
+        written = created + list(changed.values())
+        transitions.record_many(
+            [(issue, None) for issue in created] + [(issue, states[issue.pk]) for issue in changed.values()],
+            request.user,
+        )
+        counters.apply(Counter(counters.state(issue) for issue in created))
+        counters.move([(counted[issue.pk], counters.state(issue)) for issue in changed.values()])
+        search.index_issues(written)
+        _issues_changed([issue.pk for issue in written])
+        _send_notifications(self._notifications(request.user, created, list(changed.values()), before))
+        return Response({'results': results})
+
+    def _parse(self, operations):
+        parsed = []
+        errors = []
+        statuses = [c[0] for c in Issue.STATUS_CHOICES]
+        for index, operation in enumerate(operations):
+            op = operation.get('op') if isinstance(operation, dict) else None
+            if op not in BULK_ISSUE_OPS:
+                errors.append({'index': index, 'detail': f"op must be one of {', '.join(BULK_ISSUE_OPS)}"})
+                continue
+            uid = operation.get('id')
+            if op != 'create' and not uid:
+                errors.append({'index': index, 'detail': 'id is required'})
+                continue
+            if op == 'delete':
+                parsed.append((op, uid, None))
+                continue
+            if op == 'move':
+                if operation.get('status') not in statuses:
+                    errors.append({'index': index, 'detail': 'Invalid status'})
+                    continue
+                parsed.append((op, uid, {'status': operation['status']}))
+                continue
+            data = operation.get('data')
+            serializer = IssueWriteSerializer(data=data if isinstance(data, dict) else {}, partial=op == 'update')
+            if not serializer.is_valid():
+                errors.append({'index': index, 'detail': serializer.errors})
+                continue
+            payload = dict(serializer.validated_data)
+            if op == 'create':
+                payload['projectId'] = data.get('projectId')
+            parsed.append((op, uid, payload))
+        return parsed, errors
+
+    def _write_relations(self, user, created, label_updates, deleted):
+        label_through = Issue.labels.through
+        replaced = [issue.pk for issue, _ in label_updates if issue.pk not in deleted]
+        if replaced:
+            label_through.objects.filter(issue_id__in=replaced).delete()
+        label_rows = {
+            (issue.pk, label_id): label_through(issue_id=issue.pk, label_id=label_id)
+            for issue, label_ids in label_updates
+            if issue.pk not in deleted
+            for label_id in label_ids
+        }
+        label_through.objects.bulk_create(list(label_rows.values()), batch_size=500)
+        if user.is_authenticated:
+            Issue.watchers.through.objects.bulk_create(
+                [Issue.watchers.through(issue_id=issue.pk, user_id=user.id) for issue in created],
+                batch_size=500,
+            )
+
+    def _notifications(self, actor, created, changed, before):
+        actor_name = actor.get_full_name() or actor.username
+        users = User.objects.in_bulk({
+            user_id
+            for issue in [*created, *changed]
+            for user_id in (issue.assignee_id, issue.reporter_id)
+            if user_id
+        })
+        rows = []
+        for issue in created:
+            rows += _notification_rows(
+                [users.get(issue.assignee_id), users.get(issue.reporter_id)],
+                title=f"New issue: {issue.key}",
+                message=f"{actor_name} created '{issue.title}'.",
+                notification_type=Notification.TYPE_INFO,
+                actor=actor,
+                action_url='/backlog',
+                metadata={'issueId': issue.uid, 'issueKey': issue.key},
+            )
+        for issue in changed:
+            prev_assignee_id, prev_status = before[issue.pk]
+            if issue.assignee_id and issue.assignee_id != prev_assignee_id:
+                rows += _notification_rows(
+                    [users.get(issue.assignee_id)],
+                    title=f"Assigned: {issue.key}",
+                    message=f"You were assigned to '{issue.title}'.",
+                    notification_type=Notification.TYPE_ASSIGNMENT,
+                    actor=actor,
+                    action_url='/board',
+                    metadata={'issueId': issue.uid, 'issueKey': issue.key},
+                )
+            if issue.status != prev_status:
+                rows += _notification_rows(
+                    [users.get(issue.assignee_id), users.get(issue.reporter_id)],
+                    title=f"Status updated: {issue.key}",
+                    message=f"Status changed from '{prev_status}' to '{issue.status}'.",
+                    notification_type=Notification.TYPE_STATUS,
+                    actor=actor,
+                    action_url='/board',
+                    metadata={'issueId': issue.uid, 'issueKey': issue.key},
+                )
+        return rows
+
+
 class IssueDetailView(APIView):
+    def get(self, request, issue_uid):
+        fields = _issue_fields(request)
+        if fields is not None:
+            issue = _issue_queryset(fields).filter(uid=issue_uid).first()
+            if not issue:
+                return Response({'detail': 'Not found'}, status=status.HTTP_404_NOT_FOUND)
+            return Response(IssueSerializer(issue, fields=fields, context={'request': request}).data)
+
+        rows = list(Issue.objects.filter(uid=issue_uid).values_list(*render_cache.ROW_VERSION_FIELDS))
+        if not rows:
+            return Response({'detail': 'Not found'}, status=status.HTTP_404_NOT_FOUND)
+        etag = representation_etag(request, render_cache.row_version(*rows[0]))
+        cached = not_modified(request, etag)
+        if cached:
+            return cached
+        return with_etag(Response(render_cache.render_issues(rows, _load_full_issues, request)[0]), etag)
+
+    @transaction.atomic
     def patch(self, request, issue_uid):
         issue = _issue_by_uid(issue_uid)
         if not issue:
             return Response({'detail': 'Not found'}, status=status.HTTP_404_NOT_FOUND)
         if not can_edit_issue(request.user, issue):
             return Response({'detail': 'Permission denied'}, status=status.HTTP_403_FORBIDDEN)
-        prev_assignee = issue.assignee
+        prev_assignee_id = issue.assignee_id
         prev_status = issue.status
         _apply_issue_payload(issue, request.data, request.user)
-        if issue.assignee and (not prev_assignee or prev_assignee.id != issue.assignee.id):
+        if issue.assignee_id and issue.assignee_id != prev_assignee_id:
             _create_notifications(
                 [issue.assignee],
                 title=f"Assigned: {issue.key}",
@@ -793,8 +1267,12 @@ class IssueDetailView(APIView):
                 action_url='/board',
                 metadata={'issueId': issue.uid, 'issueKey': issue.key},
             )
+        if _prefers_minimal(request):
+            changed = [name for name in IssueSerializer.Meta.fields if name in request.data]
+            return _issue_fields_response(issue, changed, request)
         return Response(_issue_response(issue, request))
 
+    @transaction.atomic
     def delete(self, request, issue_uid):
         issue = _issue_by_uid(issue_uid)
         if not issue:
@@ -806,6 +1284,7 @@ class IssueDetailView(APIView):
 
 
 class IssueMoveView(APIView):
+    @transaction.atomic
     def post(self, request, issue_uid):
         issue = _issue_by_uid(issue_uid)
         if not issue:
@@ -815,8 +1294,12 @@ class IssueMoveView(APIView):
         new_status = request.data.get('status')
         if new_status not in [c[0] for c in Issue.STATUS_CHOICES]:
             return Response({'detail': 'Invalid status'}, status=status.HTTP_400_BAD_REQUEST)
+        before = transitions.snapshot(issue)
         issue.status = new_status
         issue.save(update_fields=['status', 'updated_at'])
+        transitions.record(issue, before, request.user)
+        if _prefers_minimal(request):
+            return _issue_fields_response(issue, ['status', 'updatedAt'], request)
         return Response(_issue_response(issue, request))
 
 
@@ -828,7 +1311,7 @@ class IssueCommentCreateView(APIView):
         content = (request.data.get('content') or '').strip()
         if not content:
             return Response({'detail': 'content is required'}, status=status.HTTP_400_BAD_REQUEST)
-        IssueComment.objects.create(issue=issue, author=request.user, content=content)
+        comment = IssueComment.objects.create(issue=issue, author=request.user, content=content)
         recipients = set(issue.watchers.all())
         recipients.add(issue.reporter)
         if issue.assignee:
@@ -855,6 +1338,8 @@ class IssueCommentCreateView(APIView):
                 action_url='/board',
                 metadata={'issueId': issue.uid, 'issueKey': issue.key, 'event': 'mention'},
             )
+        if _prefers_minimal(request):
+            return _minimal_response(CommentSerializer(comment).data, status.HTTP_201_CREATED)
         return Response(_issue_response(issue, request))
 
 
@@ -889,6 +1374,8 @@ class IssueCommentDetailView(APIView):
                 action_url='/board',
                 metadata={'issueId': issue.uid, 'issueKey': issue.key, 'event': 'mention'},
             )
+        if _prefers_minimal(request):
+            return _minimal_response(CommentSerializer(comment).data)
         return Response(_issue_response(issue, request))
 
     def delete(self, request, issue_uid, comment_uid):
@@ -905,6 +1392,8 @@ class IssueCommentDetailView(APIView):
             return Response({'detail': 'Permission denied'}, status=status.HTTP_403_FORBIDDEN)
 
         comment.delete()
+        if _prefers_minimal(request):
+            return _minimal_response(None, status.HTTP_204_NO_CONTENT)
         return Response(_issue_response(issue, request))
 
 
@@ -923,6 +1412,8 @@ class IssueLogTimeView(APIView):
             return Response({'detail': 'hours must be > 0'}, status=status.HTTP_400_BAD_REQUEST)
         issue.logged_hours += hours
         issue.save(update_fields=['logged_hours', 'updated_at'])
+        if _prefers_minimal(request):
+            return _issue_fields_response(issue, ['timeTracking', 'updatedAt'], request)
         return Response(_issue_response(issue, request))
 
 
@@ -935,6 +1426,8 @@ class IssueWatchToggleView(APIView):
             issue.watchers.remove(request.user)
         else:
             issue.watchers.add(request.user)
+        if _prefers_minimal(request):
+            return _issue_fields_response(issue, ['watchers'], request)
         return Response(_issue_response(issue, request))
 
 
@@ -952,7 +1445,9 @@ class IssueLinkCreateView(APIView):
             return Response({'detail': 'Target issue not found'}, status=status.HTTP_400_BAD_REQUEST)
         if link_type not in [c[0] for c in IssueLink.TYPE_CHOICES]:
             return Response({'detail': 'Invalid link type'}, status=status.HTTP_400_BAD_REQUEST)
-        IssueLink.objects.get_or_create(issue=issue, target_issue=target_issue, link_type=link_type)
+        link, _ = IssueLink.objects.get_or_create(issue=issue, target_issue=target_issue, link_type=link_type)
+        if _prefers_minimal(request):
+            return _minimal_response(LinkSerializer(link).data, status.HTTP_201_CREATED)
         return Response(_issue_response(issue, request))
 
 
@@ -964,6 +1459,8 @@ class IssueLinkDeleteView(APIView):
         if not can_edit_issue(request.user, issue):
             return Response({'detail': 'Permission denied'}, status=status.HTTP_403_FORBIDDEN)
         IssueLink.objects.filter(issue=issue, uid=link_uid).delete()
+        if _prefers_minimal(request):
+            return _minimal_response(None, status.HTTP_204_NO_CONTENT)
         return Response(_issue_response(issue, request))
 
 
@@ -980,13 +1477,15 @@ class IssueAttachmentUploadView(APIView):
         incoming = request.FILES.get('file')
         if not incoming:
             return Response({'detail': 'file is required'}, status=status.HTTP_400_BAD_REQUEST)
-        IssueAttachment.objects.create(
+        attachment = IssueAttachment.objects.create(
             issue=issue,
             uploaded_by=request.user,
             file=incoming,
             original_name=incoming.name,
             size=incoming.size,
         )
+        if _prefers_minimal(request):
+            return _minimal_response(AttachmentSerializer(attachment, context={'request': request}).data, status.HTTP_201_CREATED)
         return Response(_issue_response(issue, request), status=status.HTTP_201_CREATED)
 
 
@@ -1001,6 +1500,8 @@ class IssueAttachmentDeleteView(APIView):
         if attachment:
             attachment.file.delete(save=False)
             attachment.delete()
+        if _prefers_minimal(request):
+            return _minimal_response(None, status.HTTP_204_NO_CONTENT)
         return Response(_issue_response(issue, request))
 
 
@@ -1249,60 +1750,184 @@ class ChatRoomReadView(APIView):
         return Response({'success': True})
 
 
-class DashboardReportView(APIView):
+class SearchView(APIView):
     def get(self, request):
+        text = (request.query_params.get('q') or '').strip()
+        if not text:
+            return Response({'detail': 'q is required'}, status=status.HTTP_400_BAD_REQUEST)
+        project_id = None
         project_uid = request.query_params.get('project_id')
-        project = _project_by_uid(project_uid)
-        if not project:
-            return Response({'detail': 'Invalid project_id'}, status=status.HTTP_400_BAD_REQUEST)
+        if project_uid:
+            project = _project_by_uid(project_uid)
+            if not project:
+                return Response({'detail': 'Invalid project_id'}, status=status.HTTP_400_BAD_REQUEST)
+            project_id = project.id
+        limit = parse_page_size(request.query_params.get('limit'), default=20)
+        issue_hits, epic_hits = search.search(text, project_id=project_id, limit=limit)
+
+        fields = _issue_fields(request, default=ISSUE_SUMMARY_FIELDS)
+        issues = {issue.id: issue for issue in _issue_queryset(fields).filter(id__in=[hit['issue_id'] for hit in issue_hits])}
+        epics = Epic.objects.select_related('project').in_bulk([hit['epic_id'] for hit in epic_hits])
+        results = []
+        for hit in issue_hits:
+            issue = issues.get(hit['issue_id'])
+            if issue:
+                results.append({
+                    'issue': IssueSerializer(issue, fields=fields, context={'request': request}).data,
+                    'matchedIn': hit['kind'],
+                    'snippet': hit['snippet'],
+                    'rank': hit['rank'],
+                })
+        return Response({
+            'results': results,
+            'epics': [
+                {**EpicSerializer(epics[hit['epic_id']]).data, 'snippet': hit['snippet'], 'rank': hit['rank']}
+                for hit in epic_hits
+                if hit['epic_id'] in epics
+            ],
+        })
 
-        active_sprint = Sprint.objects.filter(project=project, status='active').first()
-        sprint_issues = Issue.objects.filter(project=project, sprint=active_sprint) if active_sprint else Issue.objects.none()
 
-        by_status = {'todo': 0, 'in_progress': 0, 'in_review': 0, 'done': 0}
-        for row in sprint_issues.values('status'):
-            by_status[row['status']] += 1
+class SyncView(APIView):
+    def get(self, request):
+        project = _project_by_uid(request.query_params.get('project_id'))
+        if not project:
+            return Response({'detail': 'Invalid project_id'}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            since = int(request.query_params.get('since') or 0)
+        except ValueError:
+            return Response({'detail': 'Invalid since token'}, status=status.HTTP_400_BAD_REQUEST)
+
+        token = current_version(project.id)
+        issue_fields = _issue_fields(request, default=[f for f in IssueSerializer.Meta.fields if f != 'comments'])
+        querysets = {
+            ProjectChange.ENTITY_ISSUE: _issue_queryset(issue_fields).filter(project=project),
+            ProjectChange.ENTITY_COMMENT: IssueComment.objects.select_related('author__profile', 'issue').filter(issue__project=project),
+            ProjectChange.ENTITY_SPRINT: Sprint.objects.select_related('project').filter(project=project),
+            ProjectChange.ENTITY_EPIC: Epic.objects.select_related('project').filter(project=project),
+            ProjectChange.ENTITY_LABEL: Label.objects.filter(project=project),
+        }
+        deleted = {entity: [] for entity, _ in ProjectChange.ENTITY_CHOICES}
+        if since:
+            latest = {}
+            changes = ProjectChange.objects.filter(project=project, version__gt=since, version__lte=token).order_by('version')
+            for entity, uid, is_deleted in changes.values_list('entity', 'uid', 'deleted'):
+                latest[(entity, uid)] = is_deleted
+            changed = {entity: [] for entity in querysets}
+            for (entity, uid), is_deleted in latest.items():
+                (deleted if is_deleted else changed)[entity].append(uid)
+            querysets = {entity: qs.filter(uid__in=changed[entity]) for entity, qs in querysets.items()}
+
+        context = {'request': request}
+        return Response({
+            'token': str(token),
+            'issues': IssueSerializer(querysets[ProjectChange.ENTITY_ISSUE], many=True, fields=issue_fields, context=context).data,
+            'comments': [
+                {**CommentSerializer(comment).data, 'issueId': comment.issue.uid}
+                for comment in querysets[ProjectChange.ENTITY_COMMENT]
+            ],
+            'sprints': SprintSerializer(querysets[ProjectChange.ENTITY_SPRINT], many=True).data,
+            'epics': EpicSerializer(querysets[ProjectChange.ENTITY_EPIC], many=True).data,
+            'labels': LabelSerializer(querysets[ProjectChange.ENTITY_LABEL], many=True).data,
+            'deleted': {
+                'issues': deleted[ProjectChange.ENTITY_ISSUE],
+                'comments': deleted[ProjectChange.ENTITY_COMMENT],
+                'sprints': deleted[ProjectChange.ENTITY_SPRINT],
+                'epics': deleted[ProjectChange.ENTITY_EPIC],
+                'labels': deleted[ProjectChange.ENTITY_LABEL],
+            },
+        })
 
-        total = sprint_issues.count()
-        done_percent = round((by_status['done'] / total) * 100) if total else 0
-        by_assignee = defaultdict(int)
-        for item in sprint_issues.exclude(assignee=None).values('assignee__profile__uid'):
-            by_assignee[item['assignee__profile__uid']] += 1
 
-        recent_issues = Issue.objects.filter(project=project).order_by('-updated_at')[:5]
+class BoardView(APIView):
+    @conditional_on_project_version
+    def get(self, request):
+        if not request.query_params.get('project_id'):
+            return Response({'detail': 'project_id is required'}, status=status.HTTP_400_BAD_REQUEST)
+        column = request.query_params.get('status')
+        if column and column not in dict(Issue.STATUS_CHOICES):
+            return Response({'detail': 'Invalid status'}, status=status.HTTP_400_BAD_REQUEST)
+        limit = parse_page_size(request.query_params.get('limit'), default=BOARD_COLUMN_SIZE)
+        cards = _filter_issues(_issue_queryset(BOARD_CARD_FIELDS), request.query_params)
+        if column:
+            return self._get_column(request, cards, column, limit)
+
+        counts = dict(
+            _filter_issues(Issue.objects.all(), request.query_params)
+            .order_by()
+            .values_list('status')
+            .annotate(total=Count('id'))
+        )
+        ranked = (
+            cards.annotate(
+                column_rank=Window(
+                    RowNumber(),
+                    partition_by=[F('status')],
+                    order_by=[F('updated_at').desc(), F('id').desc()],
+                )
+            )
+            .filter(column_rank__lte=limit)
+            .order_by('status', '-updated_at', '-id')
+        )
+        by_status = defaultdict(list)
+        for issue in ranked:
+            by_status[issue.status].append(issue)
+
+        columns = []
+        for value, name in Issue.STATUS_CHOICES:
+            issues = by_status[value]
+            total = counts.get(value, 0)
+            last = issues[-1] if issues else None
+            columns.append({
+                'status': value,
+                'name': name,
+                'count': total,
+                'cards': IssueSerializer(issues, many=True, fields=BOARD_CARD_FIELDS).data,
+                'next': encode_cursor(last.updated_at, last.id) if last and total > len(issues) else None,
+            })
+        return Response({'columns': columns})
+
+    def _get_column(self, request, cards, column, limit):
+        try:
+            issues, next_cursor = keyset_page(cards, request.query_params.get('cursor'), limit)
+        except InvalidCursor:
+            return Response({'detail': 'Invalid cursor'}, status=status.HTTP_400_BAD_REQUEST)
         return Response({
-            'activeSprintId': active_sprint.uid if active_sprint else None,
-            'stats': {
-                'byStatus': by_status,
-                'total': total,
-                'donePercent': done_percent,
-                'byAssignee': by_assignee,
-            },
-            'recentActivity': IssueSerializer(recent_issues, many=True, context={'request': request}).data,
+            'status': column,
+            'cards': IssueSerializer(issues, many=True, fields=BOARD_CARD_FIELDS).data,
+            'next': next_cursor,
         })
 
 
+class IssueRenderCacheStatsView(APIView):
+    def get(self, request):
+        if not can_manage_project(request.user):
+            return Response({'detail': 'Permission denied'}, status=status.HTTP_403_FORBIDDEN)
+        return Response(render_cache.stats())
+
+
+class DashboardReportView(APIView):
+    def get(self, request):
+        project_uid = request.query_params.get('project_id')
+        project = _project_by_uid(project_uid)
+        if not project:
+            return Response({'detail': 'Invalid project_id'}, status=status.HTTP_400_BAD_REQUEST)
+
+        fields = _issue_fields(request)
+        if fields is None:
+            recent_activity = _render_issues(Issue.objects.filter(project=project).order_by('-updated_at')[:5], request)
+        else:
+            recent_issues = _issue_queryset(fields).filter(project=project).order_by('-updated_at')[:5]
+            recent_activity = IssueSerializer(recent_issues, many=True, fields=fields, context={'request': request}).data
+        return Response({**report_cache.dashboard(project), 'recentActivity': recent_activity})
+
+
 class BurndownReportView(APIView):
     def get(self, request):
         sprint = _sprint_by_uid(request.query_params.get('sprint_id'))
         if not sprint:
             return Response([])
-
-        start = sprint.start_date
-        end = sprint.end_date
-        total_issues = sprint.issues.count()
-        days = (end - start).days or 1
-        data = []
-        for idx in range(days + 1):
-            day = start + timedelta(days=idx)
-            done_issues = 0
-            for issue in sprint.issues.filter(status='done'):
-                if issue.updated_at.date() <= day:
-                    done_issues += 1
-            remaining = max(total_issues - done_issues, 0)
-            ideal = max(round(total_issues - ((total_issues / days) * idx), 1), 0)
-            data.append({'date': day.isoformat(), 'remaining': remaining, 'ideal': ideal})
-        return Response(data)
+        return Response(report_cache.burndown(sprint))
 
 
 class VelocityReportView(APIView):
@@ -1310,14 +1935,35 @@ class VelocityReportView(APIView):
         project = _project_by_uid(request.query_params.get('project_id'))
         if not project:
             return Response([])
-        sprints = Sprint.objects.filter(project=project).order_by('start_date')
-        payload = []
-        for sprint in sprints:
-            sprint_issues = Issue.objects.filter(sprint=sprint)
-            committed = sprint_issues.count()
-            completed = sprint_issues.filter(status='done').count()
-            payload.append({'sprint': sprint.name, 'committed': committed, 'completed': completed})
-        return Response(payload)
+        return Response(report_cache.velocity(project))
+
+
+def _flow_report(request, report, param, default, maximum=flow.MAX_WINDOW_DAYS):
+    project = _project_by_uid(request.query_params.get('project_id'))
+    if not project:
+        return Response({'detail': 'Invalid project_id'}, status=status.HTTP_400_BAD_REQUEST)
+    window = flow.parse_window(request.query_params.get(param), default, maximum)
+    return Response(report_cache.flow_report(report, project.id, window))
+
+
+class CycleTimeReportView(APIView):
+    def get(self, request):
+        return _flow_report(request, 'cycle-time', 'days', flow.CYCLE_TIME_DAYS)
+
+
+class LeadTimeReportView(APIView):
+    def get(self, request):
+        return _flow_report(request, 'lead-time', 'days', flow.LEAD_TIME_DAYS)
+
+
+class ThroughputReportView(APIView):
+    def get(self, request):
+        return _flow_report(request, 'throughput', 'weeks', flow.THROUGHPUT_WEEKS, flow.MAX_THROUGHPUT_WEEKS)
+
+
+class CumulativeFlowReportView(APIView):
+    def get(self, request):
+        return _flow_report(request, 'cumulative-flow', 'days', flow.CUMULATIVE_FLOW_DAYS)
 
 
 class NotificationListView(APIView):
@@ -1331,33 +1977,27 @@ class NotificationListView(APIView):
 
 class NotificationUnreadCountView(APIView):
     def get(self, request):
-        count = Notification.objects.filter(user=request.user, is_read=False).count()
-        return Response({'unreadCount': count})
+        return Response({'unreadCount': unread.count(request.user.id)})
 
 
 class NotificationMarkReadView(APIView):
+    @transaction.atomic
     def post(self, request, notification_uid):
-        notification = Notification.objects.filter(uid=notification_uid, user=request.user).first()
+        notification = Notification.objects.filter(uid=notification_uid, user=request.user).only('id', 'uid').first()
         if not notification:
             return Response({'detail': 'Not found'}, status=status.HTTP_404_NOT_FOUND)
-        notification.is_read = True
-        notification.save(update_fields=['is_read'])
-        channel_layer = get_channel_layer()
-        if channel_layer:
-            async_to_sync(channel_layer.group_send)(
-                f'user_notifications_{request.user.id}',
-                {'type': 'notification_event', 'event': 'read'},
-            )
-        return Response({'success': True})
+        if Notification.objects.filter(pk=notification.pk, is_read=False).update(is_read=True):
+            unread.adjust({request.user.id: -1})
+        unread_count = unread.count(request.user.id)
+        side_effects.send([fanout.notification_event(request.user.id, 'read', unread_count, notificationIds=[notification.uid])])
+        return Response({'success': True, 'unreadCount': unread_count})
 
 
 class NotificationReadAllView(APIView):
+    @transaction.atomic
     def post(self, request):
-        Notification.objects.filter(user=request.user, is_read=False).update(is_read=True)
-        channel_layer = get_channel_layer()
-        if channel_layer:
-            async_to_sync(channel_layer.group_send)(
-                f'user_notifications_{request.user.id}',
-                {'type': 'notification_event', 'event': 'read_all'},
-            )
-        return Response({'success': True})
+        marked = Notification.objects.filter(user=request.user, is_read=False).update(is_read=True)
+        unread.adjust({request.user.id: -marked})
+        unread_count = unread.count(request.user.id)
+        side_effects.send([fanout.notification_event(request.user.id, 'read_all', unread_count)])
+        return Response({'success': True, 'unreadCount': unread_count})
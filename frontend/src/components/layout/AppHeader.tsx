@@ -194,6 +194,7 @@ export function AppHeader() {
                   >
                     <div className="flex items-center gap-2">
                       <p className="text-xs font-semibold flex-1 truncate">{n.title}</p>
+                      {n.count > 1 && <span className="text-2xs text-muted-foreground shrink-0">×{n.count}</span>}
                       {!n.isRead && <span className="h-2 w-2 rounded-full bg-primary shrink-0" />}
                     </div>
                     <p className="text-xs text-muted-foreground mt-0.5 line-clamp-2">{n.message}</p>
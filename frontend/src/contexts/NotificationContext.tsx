@@ -3,6 +3,16 @@ import { apiRequest, getNotificationsWsUrl, getToken } from '@/lib/api';
 import { Notification } from '@/types/jira';
 import { useAuth } from '@/contexts/AuthContext';
 
+type NotificationSocketEvent = {
+  type: 'notification_event';
+  event: string;
+  notifications?: Notification[];
+  notificationIds?: string[];
+  unreadCount?: number;
+};
+
+const NOTIFICATION_LIST_LIMIT = 50;
+
 type NotificationContextType = {
   notifications: Notification[];
   unreadCount: number;
@@ -57,6 +67,29 @@ export const NotificationProvider = ({ children }: { children: ReactNode }) => {
     setUnreadCount(0);
   }, []);
 
+  const applySocketEvent = useCallback((payload: NotificationSocketEvent) => {
+    if (typeof payload.unreadCount !== 'number') {
+      refreshNotifications();
+      return;
+    }
+    if (payload.event === 'created' && payload.notifications) {
+      const incoming = payload.notifications;
+      setNotifications((prev) => {
+        const ids = new Set(incoming.map((n) => n.id));
+        return [...incoming, ...prev.filter((n) => !ids.has(n.id))].slice(0, NOTIFICATION_LIST_LIMIT);
+      });
+    } else if (payload.event === 'read' && payload.notificationIds) {
+      const ids = new Set(payload.notificationIds);
+      setNotifications((prev) => prev.map((n) => (ids.has(n.id) ? { ...n, isRead: true } : n)));
+    } else if (payload.event === 'read_all') {
+      setNotifications((prev) => prev.map((n) => ({ ...n, isRead: true })));
+    } else {
+      refreshNotifications();
+      return;
+    }
+    setUnreadCount(payload.unreadCount);
+  }, [refreshNotifications]);
+
   useEffect(() => {
     if (!isAuthenticated) {
       setNotifications([]);
@@ -80,7 +113,7 @@ export const NotificationProvider = ({ children }: { children: ReactNode }) => {
         try {
           const payload = JSON.parse(event.data);
           if (payload?.type === 'notification_event') {
-            refreshNotifications();
+            applySocketEvent(payload as NotificationSocketEvent);
           }
         } catch {
           // Ignore malformed websocket payloads.
@@ -100,7 +133,7 @@ export const NotificationProvider = ({ children }: { children: ReactNode }) => {
       if (reconnectTimer) clearTimeout(reconnectTimer);
       if (socket) socket.close();
     };
-  }, [isAuthenticated, refreshNotifications]);
+  }, [isAuthenticated, refreshNotifications, applySocketEvent]);
 
   const value = useMemo(() => ({
     notifications,
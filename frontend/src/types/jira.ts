@@ -115,6 +115,7 @@ export interface Notification {
   isRead: boolean;
   actionUrl: string;
   metadata: Record<string, unknown>;
+  count: number;
   createdAt: string;
 }
 